@@ -1,7 +1,34 @@
 #!/usr/bin/env python3
-"""Setup script for SoilPy package."""
+"""Setup script for SoilPy package.
+
+Set ``SOILPY_MYPYC=1`` to compile the pure-function modules listed in
+``MYPYC_MODULES`` to C extensions with mypyc. ``mypy`` has to be installed in
+the build environment, e.g. ``SOILPY_MYPYC=1 pip install --no-build-isolation .``
+"""
+
+import os
 
 from setuptools import setup
 
+# Pydantic model modules (models/*) cannot go through mypyc, so only plain
+# typed function modules are compiled.
+MYPYC_MODULES = [
+    "src/soilpy/validation.py",
+    "src/soilpy/bearing_capacity/helper_functions.py",
+    "src/soilpy/consolidation_settlement/helper_functions.py",
+    "src/soilpy/elastic_settlement/reduction_factors.py",
+]
+
+
+def get_ext_modules():
+    """Returns the mypyc extensions when the compiled build is requested."""
+    if os.environ.get("SOILPY_MYPYC", "0") != "1":
+        return []
+
+    from mypyc.build import mypycify
+
+    return mypycify(["--follow-imports=silent", *MYPYC_MODULES], opt_level="3")
+
+
 if __name__ == "__main__":
-    setup()
+    setup(ext_modules=get_ext_modules())
@@ -0,0 +1,118 @@
+"""Numeric kernels for the swelling potential calculations."""
+
+from typing import Tuple
+
+import numpy as np
+
+from .helper import njit
+
+# Kayabalu & Yaldiz (2014) swelling pressure: coefficients of water content, dry unit
+# weight, liquid limit and plastic limit, plus the constant term
+_KY_COEFF = np.array([-3.08, 102.5, 0.635, 4.24], dtype=np.float64)
+_KY_BIAS = -220.8
+
+# Lower clip of the delta stress denominator in `_compute_numpy`
+_MIN_DENOMINATOR = 1e-300
+
+
+# No fastmath, LLVM could then re-associate the sums and the results would
+# differ from `_compute_numpy` in the last bits
+@njit(cache=True)
+def _compute(
+    centers: np.ndarray,
+    eff_stress: np.ndarray,
+    wc: np.ndarray,
+    ll: np.ndarray,
+    pl: np.ndarray,
+    dry_uw: np.ndarray,
+    has_plastic: np.ndarray,
+    df: float,
+    width: float,
+    length: float,
+    vertical_load: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Computes the per-layer swelling potential values in a single loop.
+
+    Args:
+        centers: Center depths of the layers in meters, increasing
+        eff_stress: Effective stresses at the layer centers in ton/m2 (0 above df)
+        wc: Water contents in percentage
+        ll: Liquid limits in percentage
+        pl: Plastic limits in percentage
+        dry_uw: Dry unit weights in ton/m3
+        has_plastic: Whether each layer has a plastic limit
+        df: Foundation depth in meters
+        width: Foundation width in meters
+        length: Foundation length in meters
+        vertical_load: Net vertical load of the foundation in ton
+
+    Returns:
+        The delta stress and swelling pressure arrays in ton/m2 and the is_safe array
+    """
+    n = centers.shape[0]
+    delta_stress = np.zeros(n)
+    swelling_pressure = np.zeros(n)
+
+    # Centers increase with depth, so the layers above the foundation level are a
+    # prefix that gets no load
+    start = np.searchsorted(centers, df)
+    for i in range(start, n):
+        dz = centers[i] - df
+        delta_stress[i] = vertical_load / ((width + dz) * (length + dz))
+
+    for i in range(n):
+        if has_plastic[i]:
+            # Summed left to right, in the same order as `_compute_numpy`
+            swelling_pressure[i] = (
+                _KY_COEFF[0] * wc[i]
+                + _KY_COEFF[1] * dry_uw[i]
+                + _KY_COEFF[2] * ll[i]
+                + _KY_COEFF[3] * pl[i]
+                + _KY_BIAS
+            )
+
+    # One array compare instead of a branch per layer
+    is_safe = np.less_equal(swelling_pressure, eff_stress + delta_stress)
+
+    return delta_stress, swelling_pressure, is_safe
+
+
+def _compute_numpy(
+    centers: np.ndarray,
+    eff_stress: np.ndarray,
+    wc: np.ndarray,
+    ll: np.ndarray,
+    pl: np.ndarray,
+    dry_uw: np.ndarray,
+    has_plastic: np.ndarray,
+    df: float,
+    width: float,
+    length: float,
+    vertical_load: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Array version of `_compute`, used when numba is not installed.
+
+    Takes the same arguments and returns the same arrays as `_compute`.
+    """
+    start = np.searchsorted(centers, df)
+    # Depth below the foundation, shared by both sides of the loaded area
+    dz = centers - df
+    # Layers above the foundation can give a zero or negative denominator, so clip
+    # it instead of branching per layer and zero their stress afterwards
+    denominator = np.maximum((width + dz) * (length + dz), _MIN_DENOMINATOR)
+    delta_stress = vertical_load / denominator
+    delta_stress[:start] = 0.0
+
+    # Summed left to right like the scalar formula, so no bits change
+    swelling_pressure = np.where(
+        has_plastic,
+        _KY_COEFF[0] * wc
+        + _KY_COEFF[1] * dry_uw
+        + _KY_COEFF[2] * ll
+        + _KY_COEFF[3] * pl
+        + _KY_BIAS,
+        0.0,
+    )
+    is_safe = np.less_equal(swelling_pressure, eff_stress + delta_stress)
+
+    return delta_stress, swelling_pressure, is_safe
@@ -26,9 +26,13 @@ from .vesic import (
     calc_base_factors,
     calc_bearing_capacity,
     calc_bearing_capacity_factors,
+    calc_bearing_capacity_factors_many,
     calc_depth_factors,
+    calc_depth_factors_batch,
     calc_ground_factors,
+    calc_ground_factors_batch,
     calc_inclination_factors,
+    calc_inclination_factors_batch,
     calc_shape_factors,
     validate_input,
 )
@@ -46,11 +50,15 @@ __all__ = [
     "TezcanOzdemirOutput",
     "validate_input",
     "calc_bearing_capacity_factors",
+    "calc_bearing_capacity_factors_many",
     "calc_shape_factors",
     "calc_base_factors",
     "calc_inclination_factors",
+    "calc_inclination_factors_batch",
     "calc_depth_factors",
+    "calc_depth_factors_batch",
     "calc_ground_factors",
+    "calc_ground_factors_batch",
     "calc_bearing_capacity",
     "calc_point_load_bearing_capacity",
     "calc_tezcan_ozdemir_bearing_capacity",
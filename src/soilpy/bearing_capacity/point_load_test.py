@@ -1,5 +1,6 @@
 """Point Load Test bearing capacity calculations for SoilPy."""
 
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import BaseModel
@@ -55,6 +56,7 @@ def validate_input(
     )
 
 
+@lru_cache(maxsize=256)
 def get_generalized_c_value(d: float) -> float:
     """Calculates the generalized size correction factor C based on the given equivalent core diameter D.
 
@@ -1,6 +1,9 @@
 """Vesic bearing capacity calculations."""
 
 import math
+from typing import Tuple
+
+import numpy as np
 
 from ..enums import AnalysisTerm
 from ..models import Foundation, Loads, SoilProfile
@@ -93,6 +96,32 @@ def calc_bearing_capacity_factors(phi: float) -> BearingCapacityFactors:
     return BearingCapacityFactors(nc=nc, nq=nq, ng=ng)
 
 
+def calc_bearing_capacity_factors_many(
+    phi: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Computes the bearing capacity factors for an array of friction angles.
+
+    Same as `calc_bearing_capacity_factors`, evaluated with NumPy ufuncs.
+
+    Args:
+        phi: Friction angles in degrees
+
+    Returns:
+        The Nc, Nq and Ng arrays
+    """
+    phi = np.asarray(phi, dtype=np.float64)
+    tan_phi = np.tan(np.radians(phi))
+    nq = np.exp(np.pi * tan_phi) * np.tan(np.radians(45.0 + phi / 2.0)) ** 2
+
+    # Nc has a 0/0 at phi = 0, where it is replaced by 5.14
+    with np.errstate(divide="ignore", invalid="ignore"):
+        nc = np.where(phi == 0.0, 5.14, (nq - 1.0) / tan_phi)
+
+    ng = 2.0 * (nq - 1.0) * tan_phi
+
+    return nc, nq, ng
+
+
 def calc_shape_factors(
     foundation: Foundation, bearing_capacity_factors: BearingCapacityFactors, phi: float
 ) -> ShapeFactors:
@@ -218,6 +247,61 @@ def calc_inclination_factors(
     return InclinationFactors(ic=ic, iq=iq, ig=ig)
 
 
+def calc_inclination_factors_batch(
+    phi: float,
+    cohesion: float,
+    bearing_capacity_factors: BearingCapacityFactors,
+    foundation: Foundation,
+    vertical_load: float,
+    horizontal_load_x: np.ndarray,
+    horizontal_load_y: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculates the inclination factors for several horizontal load pairs at once.
+
+    Same as `calc_inclination_factors`, with the horizontal loads given as arrays.
+
+    Args:
+        phi: Internal friction angle of the soil in degrees
+        cohesion: Cohesion of the soil in kPa
+        bearing_capacity_factors: Reference to the BearingCapacityFactors struct
+        foundation: Reference to the Foundation struct
+        vertical_load: Vertical load
+        horizontal_load_x: Horizontal loads in x-direction
+        horizontal_load_y: Horizontal loads in y-direction
+
+    Returns:
+        The ic, iq and ig arrays
+    """
+    if foundation.foundation_width is None or foundation.foundation_length is None:
+        raise ValueError("Foundation width and length must be set")
+    if foundation.effective_width is None or foundation.effective_length is None:
+        raise ValueError("Effective width and length must be set")
+
+    w = foundation.foundation_width
+    l = foundation.foundation_length
+    hb = np.asarray(horizontal_load_x, dtype=np.float64)
+    hl = np.asarray(horizontal_load_y, dtype=np.float64)
+    hi = hb + hl
+
+    area = foundation.effective_length * foundation.effective_width
+    ca = cohesion * 0.75
+    mb = (2.0 + w / l) / (1.0 + w / l)
+    ml = (2.0 + l / w) / (1.0 + l / w)
+    m = np.where(hb == 0.0, ml, np.where(hl == 0.0, mb, math.sqrt(mb**2 + ml**2)))
+
+    if phi == 0.0:
+        ic = 1.0 - m * hi / (area * ca * bearing_capacity_factors.nc)
+        ones = np.ones_like(hi)
+        return ic, ones, ones.copy()
+
+    base = 1.0 - hi / (vertical_load + area * ca / math.tan(math.radians(phi)))
+    iq = base**m
+    ic = iq - (1.0 - iq) / (bearing_capacity_factors.nq - 1.0)
+    ig = base ** (m + 1.0)
+
+    return ic, iq, ig
+
+
 def calc_depth_factors(foundation: Foundation, phi: float) -> DepthFactors:
     """Calculates the depth factors (dc, dq, dg) based on foundation geometry and soil friction angle.
 
@@ -247,6 +331,36 @@ def calc_depth_factors(foundation: Foundation, phi: float) -> DepthFactors:
     return DepthFactors(dc=dc, dq=dq, dg=dg)
 
 
+def calc_depth_factors_batch(
+    foundation_width: float, foundation_depth: np.ndarray, phi: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculates the depth factors for arrays of foundation depths and friction angles.
+
+    Same as `calc_depth_factors`, element-wise over broadcast arrays.
+
+    Args:
+        foundation_width: Foundation width in meters
+        foundation_depth: Foundation depths in meters
+        phi: Friction angles in degrees
+
+    Returns:
+        The dc, dq and dg arrays
+    """
+    df, phi = np.broadcast_arrays(
+        np.asarray(foundation_depth, dtype=np.float64),
+        np.asarray(phi, dtype=np.float64),
+    )
+    k = df / foundation_width
+    db = np.where(k <= 1.0, k, np.arctan(np.radians(k)))
+
+    phi_rad = np.radians(phi)
+    dc = np.where(phi == 0.0, 0.4 * db, 1.0 + 0.4 * db)
+    dq = 1.0 + 2.0 * np.tan(phi_rad) * (1.0 - np.sin(phi_rad)) ** 2 * db
+    dg = np.ones_like(db)
+
+    return dc, dq, dg
+
+
 def calc_ground_factors(iq: float, slope_angle: float, phi: float) -> GroundFactors:
     """Calculates the ground modification factors (gc, gq, gg) due to slope.
 
@@ -270,6 +384,42 @@ def calc_ground_factors(iq: float, slope_angle: float, phi: float) -> GroundFact
     return GroundFactors(gc=gc, gq=gq, gg=gg)
 
 
+def calc_ground_factors_batch(
+    iq: np.ndarray, slope_angle: np.ndarray, phi: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculates the ground modification factors for arrays of inputs.
+
+    Same as `calc_ground_factors`, element-wise over broadcast arrays.
+
+    Args:
+        iq: Load inclination factors (between 0 and 1)
+        slope_angle: Slope angles in degrees
+        phi: Soil friction angles in degrees
+
+    Returns:
+        The gc, gq and gg arrays
+    """
+    iq, slope_angle, phi = np.broadcast_arrays(
+        np.asarray(iq, dtype=np.float64),
+        np.asarray(slope_angle, dtype=np.float64),
+        np.asarray(phi, dtype=np.float64),
+    )
+    slope_rad = np.radians(slope_angle)
+
+    # The phi = 0 rows divide by tan(0), their value is replaced by np.where
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gc = np.where(
+            phi == 0.0,
+            slope_rad / 5.14,
+            iq - (1.0 - iq) / (5.14 * np.tan(np.radians(phi))),
+        )
+
+    gq = (1.0 - np.tan(slope_rad)) ** 2
+    gg = gq.copy()
+
+    return gc, gq, gg
+
+
 def calc_bearing_capacity(
     soil_profile: SoilProfile,
     foundation: Foundation,
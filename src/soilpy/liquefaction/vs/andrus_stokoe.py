@@ -3,8 +3,15 @@
 import math
 from typing import List
 
-from soilpy.helper import interp1d
-from soilpy.liquefaction.helper_functions import calc_csr, calc_msf, calc_rd
+import numpy as np
+
+from soilpy.helper import njit
+from soilpy.liquefaction.helper_functions import (
+    calc_csr,
+    calc_msf,
+    calc_rd,
+    interp_linear,
+)
 from soilpy.liquefaction.models import (
     CommonLiquefactionLayerResult,
     VSLiquefactionLayerResult,
@@ -13,6 +20,10 @@ from soilpy.liquefaction.models import (
 from soilpy.models import Masw, SoilProfile
 from soilpy.validation import ValidationError
 
+# q of the settlement formula against dr
+_DR_TABLE = np.array([30.0, 40.0, 50.0, 60.0, 70.0, 80.0, 90.0])
+_Q_TABLE = np.array([33.0, 45.0, 60.0, 80.0, 110.0, 147.0, 200.0])
+
 
 def validate_input(masw: Masw, soil_profile: SoilProfile) -> None:
     """Validates the input data for liquefaction calculations.
@@ -80,6 +91,7 @@ def calc_cn(effective_stress: float) -> float:
     return min(cn, 1.7)
 
 
+@njit(cache=True, fastmath=True)
 def calc_settlement(fs: float, layer_thickness: float, vs1: float) -> float:
     """Calculates settlement due to liquefaction for a single layer.
 
@@ -101,10 +113,7 @@ def calc_settlement(fs: float, layer_thickness: float, vs1: float) -> float:
     b1 = -9.3372
     b2 = 0.7975
 
-    dr_list = [30.0, 40.0, 50.0, 60.0, 70.0, 80.0, 90.0]
-    q_list = [33.0, 45.0, 60.0, 80.0, 110.0, 147.0, 200.0]
-
-    q = interp1d(dr_list, q_list, dr)
+    q = interp_linear(_DR_TABLE, _Q_TABLE, dr)
 
     if fs > 2.0:
         settlement = 0.0
@@ -149,8 +158,7 @@ def calc_liquefacion(
         thickness = layer.thickness
         depth = layer.depth
         rd = calc_rd(depth)
-        effective_stress = soil_profile.calc_effective_stress(depth)
-        normal_stress = soil_profile.calc_normal_stress(depth)
+        normal_stress, effective_stress = soil_profile.calc_stresses(depth)
         soil_layer = soil_profile.get_layer_at_depth(depth)
         plasticity_index = soil_layer.plasticity_index
         masw_layer = masw_exp.get_layer_at_depth(depth)
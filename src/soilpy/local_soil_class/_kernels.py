@@ -0,0 +1,53 @@
+"""Numeric kernels for the local soil classification calculations."""
+
+from typing import Tuple
+
+import numpy as np
+
+from soilpy.helper import njit
+
+
+@njit(cache=True)
+def select_top_layers(
+    thicknesses: np.ndarray, values: np.ndarray, max_depth: float = 30.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Selects the layers of a harmonic average over the top of a profile.
+
+    Layers whose thickness or value is not positive (or NaN) are skipped and do not
+    use up depth. The layer that reaches max_depth is cut there.
+
+    Args:
+        thicknesses: Layer thicknesses in meters
+        values: Layer values to be averaged, e.g. Cu, N or Vs
+        max_depth: Depth the average is taken over in meters
+
+    Returns:
+        The used thicknesses, the values and the thickness / value ratios of the
+        selected layers
+    """
+    n = thicknesses.shape[0]
+    used = np.empty(n)
+    selected = np.empty(n)
+    ratios = np.empty(n)
+    count = 0
+    remaining = max_depth
+
+    for i in range(n):
+        if remaining <= 0.0:
+            break
+
+        thickness = thicknesses[i]
+        value = values[i]
+        # Written so that NaN (a missing field) is skipped too
+        if not (thickness > 0.0 and value > 0.0):
+            continue
+
+        thickness = min(thickness, remaining)
+        used[count] = thickness
+        selected[count] = value
+        ratios[count] = thickness / value
+        count += 1
+
+        remaining -= thickness
+
+    return used[:count], selected[:count], ratios[:count]
@@ -4,6 +4,7 @@ from typing import List
 
 from pydantic import BaseModel
 
+from soilpy.local_soil_class._kernels import select_top_layers
 from soilpy.models import SoilProfile
 from soilpy.validation import ValidationError
 
@@ -46,34 +47,16 @@ def compute_cu_30(profile: SoilProfile) -> List[CuLayerData]:
     Returns:
         List of CuLayerData for the top 30m
     """
-    remaining_depth = 30.0
-    result: List[CuLayerData] = []
-
-    for layer in profile.layers:
-        if remaining_depth <= 0.0:
-            break
-
-        if layer.thickness is None:
-            continue
-
-        thickness = min(layer.thickness, remaining_depth)
-        cu = layer.cu or 0.0
-
-        if cu <= 0.0:
-            continue  # Skip layer with Cu == 0
-
-        h_over_cu = thickness / cu
-        result.append(
-            CuLayerData(
-                thickness=thickness,
-                cu=cu,
-                h_over_cu=h_over_cu,
-            )
+    # None is NaN in the arrays, such layers are skipped like layers with Cu == 0
+    soa = profile.layer_soa()
+    used, cus, h_over_cus = select_top_layers(soa["thickness"], soa["cu"])
+
+    return [
+        CuLayerData(thickness=thickness, cu=cu, h_over_cu=h_over_cu)
+        for thickness, cu, h_over_cu in zip(
+            used.tolist(), cus.tolist(), h_over_cus.tolist()
         )
-
-        remaining_depth -= thickness
-
-    return result
+    ]
 
 
 def calc_lsc_by_cu(soil_profile: SoilProfile) -> CuSoilClassificationResult:
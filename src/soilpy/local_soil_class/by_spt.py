@@ -2,8 +2,10 @@
 
 from typing import List
 
+import numpy as np
 from pydantic import BaseModel
 
+from soilpy.local_soil_class._kernels import select_top_layers
 from soilpy.models import SPT, SPTExp
 from soilpy.validation import ValidationError
 
@@ -61,42 +63,17 @@ def compute_n_30(spt_exp: SPTExp) -> List[NLayerData]:
     Returns:
         List of NLayerData for the top 30m
     """
-    result: List[NLayerData] = []
-    remaining_depth = 30.0
-    blows = spt_exp.blows
-
-    for i, blow in enumerate(blows):
-        if remaining_depth <= 0.0:
-            break
-
-        previous_depth = 0.0 if i == 0 else blows[i - 1].depth
-        thickness = min(blow.depth - previous_depth, remaining_depth)
-
-        if thickness <= 0.0:
-            continue  # Skip invalid thickness
-
-        # Handle None n60 values
-        if blow.n60 is None:
-            continue  # Skip missing n values
-
-        n = blow.n60.to_i32()  # Refusal handled inside to_i32()
-
-        if n <= 0.0:
-            continue  # Skip invalid or missing n values
-
-        h_over_n = thickness / n
-
-        result.append(
-            NLayerData(
-                thickness=thickness,
-                n=n,
-                h_over_n=h_over_n,
-            )
+    # Refusals are 50 in the N array, missing n values are NaN and skipped
+    ns = spt_exp.n_array("n60")
+    thicknesses = np.diff(spt_exp.depth_array(), prepend=0.0)
+    used, ns, h_over_ns = select_top_layers(thicknesses, ns)
+
+    return [
+        NLayerData(thickness=thickness, n=n, h_over_n=h_over_n)
+        for thickness, n, h_over_n in zip(
+            used.tolist(), ns.tolist(), h_over_ns.tolist()
         )
-
-        remaining_depth -= thickness
-
-    return result
+    ]
 
 
 def calc_lsc_by_spt(spt: SPT) -> SptSoilClassificationResult:
@@ -4,6 +4,7 @@ from typing import List
 
 from pydantic import BaseModel
 
+from soilpy.local_soil_class._kernels import select_top_layers
 from soilpy.models import Masw, MaswExp
 from soilpy.validation import ValidationError
 
@@ -46,34 +47,16 @@ def compute_vs_30(masw_exp: MaswExp) -> List[VsLayerData]:
     Returns:
         List of VsLayerData for the top 30m
     """
-    remaining_depth = 30.0
-    result: List[VsLayerData] = []
-
-    for layer in masw_exp.layers:
-        if remaining_depth <= 0.0:
-            break
-
-        if layer.thickness is None or layer.vs is None:
-            continue
-
-        thickness = min(layer.thickness, remaining_depth)
-        vs = layer.vs
-
-        if vs <= 0.0:
-            continue  # Skip layer with vs == 0
-
-        h_over_vs = thickness / vs
-        result.append(
-            VsLayerData(
-                thickness=thickness,
-                vs=vs,
-                h_over_vs=h_over_vs,
-            )
+    # None is NaN in the arrays, such layers are skipped like layers with Vs == 0
+    soa = masw_exp.layer_soa()
+    used, vss, h_over_vss = select_top_layers(soa["thickness"], soa["vs"])
+
+    return [
+        VsLayerData(thickness=thickness, vs=vs, h_over_vs=h_over_vs)
+        for thickness, vs, h_over_vs in zip(
+            used.tolist(), vss.tolist(), h_over_vss.tolist()
         )
-
-        remaining_depth -= thickness
-
-    return result
+    ]
 
 
 def calc_lsc_by_vs(masw: Masw) -> VsSoilClassificationResult:
@@ -1,7 +1,8 @@
 """Foundation model for SoilPy."""
 
-from typing import Optional
+from typing import Optional, Tuple
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 from ..validation import ValidationError, validate_field
@@ -87,6 +88,33 @@ class Foundation(BaseModel):
         self.effective_width = max(min(b_, l_), 0.0)
         self.effective_length = max(max(b_, l_), 0.0)
 
+    def calc_effective_lengths_batch(
+        self, ex: np.ndarray, ey: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculates effective lengths for several load cases at once.
+
+        Same as `calc_effective_lengths`, but returns the results instead of
+        setting them on the foundation.
+
+        Args:
+            ex: Eccentricities in x-direction (m)
+            ey: Eccentricities in y-direction (m)
+
+        Returns:
+            The effective widths and the effective lengths (m)
+        """
+        if self.foundation_width is None or self.foundation_length is None:
+            raise ValueError(
+                "Foundation width and length must be set before calculating effective lengths"
+            )
+
+        b_ = self.foundation_width - 2.0 * np.asarray(ex, dtype=np.float64)
+        l_ = self.foundation_length - 2.0 * np.asarray(ey, dtype=np.float64)
+
+        effective_width = np.maximum(np.minimum(b_, l_), 0.0)
+        effective_length = np.maximum(np.maximum(b_, l_), 0.0)
+        return effective_width, effective_length
+
     def validate(self, fields: list[str]) -> None:
         """Validates specific fields of the Foundation using field names.
 
@@ -1,12 +1,28 @@
 """Loads model for SoilPy."""
 
-from typing import Optional
+from typing import Optional, Sequence
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 from ..enums import LoadCase, SelectionMethod
 from ..validation import ValidationError, validate_field
 
+# Loads field of each load case and Stress field of each load severity, in the
+# row and column order of Loads.stress_table
+_LOAD_CASE_FIELDS = {
+    LoadCase.SERVICE_LOAD: "service_load",
+    LoadCase.ULTIMATE_LOAD: "ultimate_load",
+    LoadCase.SEISMIC_LOAD: "seismic_load",
+}
+_SEVERITY_FIELDS = {
+    SelectionMethod.MIN: "min",
+    SelectionMethod.AVG: "avg",
+    SelectionMethod.MAX: "max",
+}
+_LOAD_CASE_INDEX = {load_case: i for i, load_case in enumerate(_LOAD_CASE_FIELDS)}
+_SEVERITY_INDEX = {severity: i for i, severity in enumerate(_SEVERITY_FIELDS)}
+
 
 class Stress(BaseModel):
     """Stress values in ton/m^2."""
@@ -46,35 +62,42 @@ class Loads(BaseModel):
         Returns:
             Vertical stress value in ton/m^2
         """
-        if load_case == LoadCase.SERVICE_LOAD:
-            if self.service_load is None:
-                return 0.0
-            if load_severity == SelectionMethod.MIN:
-                return self.service_load.min or 0.0
-            elif load_severity == SelectionMethod.AVG:
-                return self.service_load.avg or 0.0
-            else:  # MAX
-                return self.service_load.max or 0.0
-
-        elif load_case == LoadCase.ULTIMATE_LOAD:
-            if self.ultimate_load is None:
-                return 0.0
-            if load_severity == SelectionMethod.MIN:
-                return self.ultimate_load.min or 0.0
-            elif load_severity == SelectionMethod.AVG:
-                return self.ultimate_load.avg or 0.0
-            else:  # MAX
-                return self.ultimate_load.max or 0.0
-
-        else:  # SEISMIC_LOAD
-            if self.seismic_load is None:
-                return 0.0
-            if load_severity == SelectionMethod.MIN:
-                return self.seismic_load.min or 0.0
-            elif load_severity == SelectionMethod.AVG:
-                return self.seismic_load.avg or 0.0
-            else:  # MAX
-                return self.seismic_load.max or 0.0
+        stress = getattr(self, _LOAD_CASE_FIELDS[load_case])
+        if stress is None:
+            return 0.0
+        return getattr(stress, _SEVERITY_FIELDS[load_severity]) or 0.0
+
+    def stress_table(self) -> np.ndarray:
+        """Returns all vertical stress values in ton/m^2 as a table.
+
+        Returns:
+            A (3, 3) array with a row per load case (service, ultimate, seismic) and
+            a column per load severity (min, avg, max), 0.0 where not set
+        """
+        table = np.zeros((3, 3))
+        for i, load_field in enumerate(_LOAD_CASE_FIELDS.values()):
+            stress = getattr(self, load_field)
+            if stress is not None:
+                table[i] = [stress.min or 0.0, stress.avg or 0.0, stress.max or 0.0]
+        return table
+
+    def get_vertical_stresses(
+        self,
+        load_cases: Sequence[LoadCase],
+        load_severities: Sequence[SelectionMethod],
+    ) -> np.ndarray:
+        """Get vertical stress values in ton/m^2 for pairs of load case and severity.
+
+        Args:
+            load_cases: Load cases
+            load_severities: Load severities, one for each load case
+
+        Returns:
+            Vertical stress values in ton/m^2, see `get_vertical_stress`
+        """
+        rows = [_LOAD_CASE_INDEX[load_case] for load_case in load_cases]
+        columns = [_SEVERITY_INDEX[severity] for severity in load_severities]
+        return self.stress_table()[rows, columns]
 
     def calc_eccentricity(self) -> tuple[float, float]:
         """Calculates the eccentricity of the loading.
@@ -1,12 +1,18 @@
 """MASW (Multichannel Analysis of Surface Waves) model for SoilPy."""
 
-from typing import List, Optional
+from operator import attrgetter
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr
 
 from ..enums import SelectionMethod
 from ..validation import ValidationError, validate_field
 
+# Fields of MaswLayer kept as arrays on MaswExp, see MaswExp.layer_soa
+_SOA_FIELDS = ("thickness", "vs", "vp", "depth")
+_layer_row = attrgetter(*_SOA_FIELDS)
+
 
 class MaswLayer(BaseModel):
     """Represents an individual MASW (Multichannel Analysis of Surface Waves) experiment layer.
@@ -75,6 +81,11 @@ class MaswExp(BaseModel):
     layers: List[MaswLayer] = Field(default_factory=list)
     name: str = ""
 
+    # Layer fields as read-only float arrays, built by layer_soa
+    _soa: Dict[str, np.ndarray] = PrivateAttr(default_factory=dict)
+    # The layer values the arrays were built from, to detect changed layers
+    _layer_rows: Optional[List[tuple]] = PrivateAttr(default=None)
+
     @classmethod
     def new(cls, layers: List[MaswLayer], name: str) -> "MaswExp":
         """Creates a new MaswExp instance.
@@ -100,10 +111,7 @@ class MaswExp(BaseModel):
         Raises:
             ValueError: If any layer has a thickness value of 0.0 or less
         """
-        if not self.layers:
-            return
-
-        bottom = 0.0
+        thicknesses = []
 
         for layer in self.layers:
             if layer.thickness is None:
@@ -114,8 +122,31 @@ class MaswExp(BaseModel):
                     "Thickness of MASW experiment must be greater than zero."
                 )
 
-            layer.depth = bottom + layer.thickness
-            bottom += layer.thickness
+            thicknesses.append(layer.thickness)
+
+        depths = np.cumsum(np.array(thicknesses, dtype=np.float64))
+        for layer, depth in zip(self.layers, depths.tolist()):
+            layer.depth = depth
+
+    def layer_soa(self) -> Dict[str, np.ndarray]:
+        """Returns the layer fields as arrays, one item per layer.
+
+        The arrays are read-only and are rebuilt whenever a layer value differs
+        from the one they were built from.
+
+        Returns:
+            A dict mapping "thickness", "vs", "vp" and "depth" to a float array, NaN
+            where the field is not set
+        """
+        rows = [_layer_row(layer) for layer in self.layers]
+        if rows != self._layer_rows:
+            # None becomes NaN in the float arrays
+            values = np.array(rows, dtype=np.float64).reshape(-1, len(_SOA_FIELDS))
+            values.flags.writeable = False
+            self._soa = {field: values[:, i] for i, field in enumerate(_SOA_FIELDS)}
+            self._layer_rows = rows
+
+        return self._soa
 
     def get_layer_at_depth(self, depth: float) -> MaswLayer:
         """Retrieves the MASW experiment layer corresponding to a given depth.
@@ -152,6 +183,29 @@ class MaswExp(BaseModel):
             layer.validate(fields)
 
 
+def _reduce_columns(values: np.ndarray, mode: SelectionMethod) -> np.ndarray:
+    """Reduces each column of values to a single value by the selection method.
+
+    Args:
+        values: Values with NaN where a value is missing, one row per experiment
+        mode: The selection method
+
+    Returns:
+        The selected value of each column, 0.0 for columns with no values
+    """
+    missing = np.isnan(values)
+    if mode == SelectionMethod.MIN:
+        result = np.where(missing, np.inf, values).min(axis=0, initial=np.inf)
+    elif mode == SelectionMethod.AVG:
+        counts = (~missing).sum(axis=0)
+        sums = np.where(missing, 0.0, values).sum(axis=0)
+        result = sums / np.maximum(counts, 1)
+    else:  # MAX
+        result = np.where(missing, -np.inf, values).max(axis=0, initial=-np.inf)
+
+    return np.where(missing.all(axis=0), 0.0, result)
+
+
 class Masw(BaseModel):
     """Represents a MASW (Multichannel Analysis of Surface Waves) model.
 
@@ -208,46 +262,37 @@ class Masw(BaseModel):
 
         mode = self.idealization_method
         self.calc_depths()
+        soas = [exp.layer_soa() for exp in self.exps if exp.layers]
+
+        # 1. Collect unique depths across all experiments, sorted
+        breakpoints = np.unique(
+            np.concatenate([[0.0]] + [soa["depth"] for soa in soas])
+        )
+        thicknesses = np.diff(breakpoints)
+        middles = (breakpoints[:-1] + breakpoints[1:]) / 2.0
+
+        # 2. Values of the layer each experiment has at the middle of each
+        # sub-layer, one row per experiment. Like MaswExp.get_layer_at_depth, that
+        # is the first layer whose depth is >= the middle, else the last layer.
+        vs_mat = np.empty((len(soas), len(middles)))
+        vp_mat = np.empty((len(soas), len(middles)))
+        for row, soa in enumerate(soas):
+            depths = soa["depth"]
+            index = np.minimum(
+                np.searchsorted(depths, middles, side="left"), len(depths) - 1
+            )
+            vs_mat[row] = soa["vs"][index]
+            vp_mat[row] = soa["vp"][index]
 
-        # 1. Collect unique depths across all experiments
-        unique_depths = {0.0}  # Add the surface depth
-        for exp in self.exps:
-            for layer in exp.layers:
-                if layer.depth is not None:
-                    unique_depths.add(layer.depth)
-
-        sorted_depths = sorted(unique_depths)
-        layers = []
-
-        def get_mode_value(values: List[float]) -> float:
-            if not values:
-                return 0.0
-            if mode == SelectionMethod.MIN:
-                return min(values)
-            elif mode == SelectionMethod.AVG:
-                return sum(values) / len(values)
-            else:  # MAX
-                return max(values)
-
-        for i in range(len(sorted_depths) - 1):
-            top = sorted_depths[i]
-            bottom = sorted_depths[i + 1]
-            thickness = bottom - top
-
-            vs_at_depth = []
-            vp_at_depth = []
-
-            for exp in self.exps:
-                layer = exp.get_layer_at_depth((top + bottom) / 2.0)
-                if layer.vs is not None:
-                    vs_at_depth.append(layer.vs)
-                if layer.vp is not None:
-                    vp_at_depth.append(layer.vp)
-
-            vs = get_mode_value(vs_at_depth)
-            vp = get_mode_value(vp_at_depth)
-
-            layers.append(MaswLayer.new(thickness, vs, vp))
+        vs_values = _reduce_columns(vs_mat, mode)
+        vp_values = _reduce_columns(vp_mat, mode)
+
+        layers = [
+            MaswLayer.new(thickness, vs, vp)
+            for thickness, vs, vp in zip(
+                thicknesses.tolist(), vs_values.tolist(), vp_values.tolist()
+            )
+        ]
 
         return MaswExp.new(layers, name)
 
@@ -1,12 +1,153 @@
 """Soil profile model for SoilPy."""
 
-from typing import List, Optional
+from bisect import bisect_left
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple, cast
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr
 
+from ..helper import HAS_NUMBA, njit
 from ..validation import ValidationError, validate_field
 
 
+@njit(cache=True, fastmath=True)
+def _calc_normal_stress_kernel(
+    thickness: np.ndarray,
+    dry: np.ndarray,
+    sat: np.ndarray,
+    gwt: float,
+    depth: float,
+) -> float:
+    """Walks the layers down to the given depth and sums up the total stress.
+
+    Args:
+        thickness: Layer thicknesses in meters
+        dry: Dry unit weights in t/m³
+        sat: Saturated unit weights in t/m³
+        gwt: Depth of the groundwater table in meters
+        depth: The depth at which to calculate total stress
+
+    Returns:
+        The total normal stress (t/m²) at the specified depth
+    """
+    total_stress = 0.0
+    top = 0.0
+    last = thickness.shape[0] - 1
+
+    for i in range(last + 1):
+        bottom = top + thickness[i]
+        reached = bottom >= depth or i == last
+        if reached:
+            bottom = depth
+
+        if dry[i] <= 1.0 and sat[i] <= 1.0:
+            raise ValueError(
+                "Dry or saturated unit weight must be greater than 1 for each layer."
+            )
+
+        dry_bottom = min(max(gwt, top), bottom)
+        total_stress += dry[i] * (dry_bottom - top) + sat[i] * (bottom - dry_bottom)
+
+        if reached:
+            break
+        top = bottom
+
+    return total_stress
+
+
+# SoilLayer fields kept as arrays on SoilProfile, see SoilProfile.layer_soa
+_SOA_FIELDS = (
+    "thickness",
+    "dry_unit_weight",
+    "saturated_unit_weight",
+    "water_content",
+    "liquid_limit",
+    "plastic_limit",
+    "elastic_modulus",
+    "poissons_ratio",
+    "cu",
+    "c_prime",
+    "phi_prime",
+)
+
+# Reads the _SOA_FIELDS of a layer followed by its center and depth
+_layer_row = attrgetter(*_SOA_FIELDS, "center", "depth")
+
+# Bumped whenever a SoilLayer is created or one of its fields changes, so a
+# SoilProfile can tell in O(1) whether its layer arrays may be stale
+_layer_edits = 0
+
+
+def _bump_layer_edits() -> None:
+    """Marks the layer arrays of every SoilProfile as possibly stale."""
+    global _layer_edits
+    _layer_edits += 1
+
+
+# Number of depths kept by SoilProfile.normal_stress_at
+_NORMAL_STRESS_CACHE_SIZE = 8
+
+# Without numba, stresses over fewer layers than this are summed in a plain loop,
+# below it the numpy call overhead outweighs the loop
+_NUMPY_MIN_LAYERS = 32
+
+# Status codes of _check_bounds
+_BOUNDS_OK = 0
+_BOUNDS_TOO_SMALL = 1
+_BOUNDS_TOO_LARGE = 2
+_BOUNDS_MISSING = 3
+
+
+@njit(cache=True)
+def _check_bounds(values: np.ndarray, min_val: float, max_val: float) -> int:
+    """Checks an array of field values against inclusive bounds.
+
+    Args:
+        values: The values to check, NaN for values that are not set
+        min_val: Minimum value, -inf for no minimum
+        max_val: Maximum value, inf for no maximum
+
+    Returns:
+        The status of the first value that fails, or _BOUNDS_OK if none does
+    """
+    for value in values:
+        if value != value:
+            return _BOUNDS_MISSING
+        if value < min_val:
+            return _BOUNDS_TOO_SMALL
+        if value > max_val:
+            return _BOUNDS_TOO_LARGE
+    return _BOUNDS_OK
+
+
+# Validation bounds (min, max) of the SoilLayer fields, None means unbounded
+_SOIL_FIELD_BOUNDS: Dict[str, Tuple[Optional[float], Optional[float]]] = {
+    "thickness": (0.0001, None),
+    "natural_unit_weight": (0.1, 10.0),
+    "dry_unit_weight": (0.1, 10.0),
+    "saturated_unit_weight": (0.1, 10.0),
+    "damping_ratio": (0.1, 100.0),
+    "fine_content": (0.0, 100.0),
+    "liquid_limit": (0.0, 100.0),
+    "plastic_limit": (0.0, 100.0),
+    "plasticity_index": (0.0, 100.0),
+    "cu": (0.0, None),
+    "c_prime": (0.0, None),
+    "phi_u": (0.0, 90.0),
+    "phi_prime": (0.0, 90.0),
+    "water_content": (0.0, 100.0),
+    "poissons_ratio": (0.0001, 0.5),
+    "elastic_modulus": (0.0001, None),
+    "void_ratio": (0.0, None),
+    "compression_index": (0.0, None),
+    "recompression_index": (0.0, None),
+    "preconsolidation_pressure": (0.0, None),
+    "mv": (0.0, None),
+    "shear_wave_velocity": (0.0, None),
+}
+
+
 class SoilLayer(BaseModel):
     """Represents a single soil layer in a geotechnical engineering model.
 
@@ -54,6 +195,16 @@ class SoilLayer(BaseModel):
         """
         return cls(thickness=thickness)
 
+    def model_post_init(self, __context: Any) -> None:
+        """Marks the layer arrays as stale, the layer may replace a listed one."""
+        _bump_layer_edits()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Sets a field and marks the layer arrays as stale if the value changed."""
+        if self.__dict__.get(name) != value:
+            _bump_layer_edits()
+        super().__setattr__(name, value)
+
     def validate_fields(self, fields: List[str]) -> None:
         """Validate based on a list of required fields by name.
 
@@ -64,157 +215,52 @@ class SoilLayer(BaseModel):
             ValidationError: If any required field is invalid
         """
         for field in fields:
-            if field == "thickness":
-                validate_field(
-                    "thickness",
-                    self.thickness,
-                    0.0001,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "natural_unit_weight":
-                validate_field(
-                    "natural_unit_weight",
-                    self.natural_unit_weight,
-                    0.1,
-                    10.0,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "dry_unit_weight":
-                validate_field(
-                    "dry_unit_weight",
-                    self.dry_unit_weight,
-                    0.1,
-                    10.0,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "saturated_unit_weight":
-                validate_field(
-                    "saturated_unit_weight",
-                    self.saturated_unit_weight,
-                    0.1,
-                    10.0,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "damping_ratio":
-                validate_field(
-                    "damping_ratio",
-                    self.damping_ratio,
-                    0.1,
-                    100.0,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "fine_content":
-                validate_field(
-                    "fine_content",
-                    self.fine_content,
-                    0.0,
-                    100.0,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "liquid_limit":
-                validate_field(
-                    "liquid_limit",
-                    self.liquid_limit,
-                    0.0,
-                    100.0,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "plastic_limit":
-                validate_field(
-                    "plastic_limit",
-                    self.plastic_limit,
-                    0.0,
-                    100.0,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "plasticity_index":
-                validate_field(
-                    "plasticity_index",
-                    self.plasticity_index,
-                    0.0,
-                    100.0,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "cu":
-                validate_field("cu", self.cu, 0.0, error_code_prefix="soil_profile")
-            elif field == "c_prime":
-                validate_field(
-                    "c_prime", self.c_prime, 0.0, error_code_prefix="soil_profile"
-                )
-            elif field == "phi_u":
-                validate_field(
-                    "phi_u", self.phi_u, 0.0, 90.0, error_code_prefix="soil_profile"
-                )
-            elif field == "phi_prime":
-                validate_field(
-                    "phi_prime",
-                    self.phi_prime,
-                    0.0,
-                    90.0,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "water_content":
-                validate_field(
-                    "water_content",
-                    self.water_content,
-                    0.0,
-                    100.0,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "poissons_ratio":
-                validate_field(
-                    "poissons_ratio",
-                    self.poissons_ratio,
-                    0.0001,
-                    0.5,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "elastic_modulus":
-                validate_field(
-                    "elastic_modulus",
-                    self.elastic_modulus,
-                    0.0001,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "void_ratio":
-                validate_field(
-                    "void_ratio", self.void_ratio, 0.0, error_code_prefix="soil_profile"
-                )
-            elif field == "compression_index":
-                validate_field(
-                    "compression_index",
-                    self.compression_index,
-                    0.0,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "recompression_index":
-                validate_field(
-                    "recompression_index",
-                    self.recompression_index,
-                    0.0,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "preconsolidation_pressure":
-                validate_field(
-                    "preconsolidation_pressure",
-                    self.preconsolidation_pressure,
-                    0.0,
-                    error_code_prefix="soil_profile",
-                )
-            elif field == "mv":
-                validate_field("mv", self.mv, 0.0, error_code_prefix="soil_profile")
-            elif field == "shear_wave_velocity":
-                validate_field(
-                    "shear_wave_velocity",
-                    self.shear_wave_velocity,
-                    0.0,
-                    error_code_prefix="soil_profile",
-                )
-            else:
+            bounds = _SOIL_FIELD_BOUNDS.get(field)
+            if bounds is None:
                 raise ValidationError(
                     code="soil_profile.invalid_field",
                     message=f"Field '{field}' is not valid for SoilLayer.",
                 )
+            min_val, max_val = bounds
+            validate_field(
+                field,
+                getattr(self, field),
+                min_val,
+                max_val,
+                error_code_prefix="soil_profile",
+            )
+
+
+class _LayerCache:
+    """Layer fields of a SoilProfile as arrays, and the values derived from them."""
+
+    __slots__ = (
+        "key",
+        "soa",
+        "bottoms",
+        "arrays",
+        "sigma_eff_centers",
+        "normal_stress",
+    )
+
+    def __init__(
+        self,
+        key: Tuple[List[SoilLayer], int, int],
+        soa: Dict[str, np.ndarray],
+        bottoms: List[float],
+    ) -> None:
+        # (layers list, its length, _layer_edits) the arrays were built at
+        self.key = key
+        # Layer fields as read-only float arrays, see SoilProfile.layer_soa
+        self.soa = soa
+        # Layer depths for get_layer_index, empty if some are missing or unsorted
+        self.bottoms = bottoms
+        # Stress calculation arrays, see SoilProfile._arrays
+        self.arrays: Optional[Dict[str, np.ndarray]] = None
+        # (ground_water_level, effective stress at each layer center)
+        self.sigma_eff_centers: Optional[Tuple[float, np.ndarray]] = None
+        # (ground_water_level, quantized depth) -> normal stress
+        self.normal_stress: Dict[Tuple[Optional[float], int], float] = {}
 
 
 class SoilProfile(BaseModel):
@@ -226,11 +272,20 @@ class SoilProfile(BaseModel):
     layers: List[SoilLayer] = Field(default_factory=list)
     ground_water_level: Optional[float] = None  # meters
 
-    def model_post_init(self, __context) -> None:
+    # Built by _layer_cache, dropped as a whole when the layers change
+    _cache: Optional[_LayerCache] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
         """Initialize layer depths after object creation."""
         if self.layers:
             self.calc_layer_depths()
 
+    def __eq__(self, other: object) -> bool:
+        """Compares the fields only, the layer cache is left out."""
+        if not isinstance(other, SoilProfile):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
     @classmethod
     def new(cls, layers: List[SoilLayer], ground_water_level: float) -> "SoilProfile":
         """Creates a new soil profile and initializes layer depths.
@@ -254,9 +309,6 @@ class SoilProfile(BaseModel):
 
     def calc_layer_depths(self) -> None:
         """Calculates center and bottom depth for each soil layer."""
-        if not self.layers:
-            return
-
         bottom = 0.0
 
         for layer in self.layers:
@@ -267,6 +319,51 @@ class SoilProfile(BaseModel):
             bottom += layer.thickness
             layer.depth = bottom
 
+        self._layer_cache()
+
+    def _layer_cache(self) -> _LayerCache:
+        """Returns the layer arrays, rebuilt first if the layers may have changed.
+
+        The check is O(1): the arrays are kept while the layers list is the same
+        object with the same length and no SoilLayer was created or changed
+        since they were built. Layers edited in place or added to the list are
+        picked up without calling `calc_layer_depths`. Everything derived from
+        the old arrays is dropped along with them.
+
+        Returns:
+            The current layer cache
+        """
+        layers = self.layers
+        # Read pydantic's private attribute storage directly, going through
+        # BaseModel.__getattr__ costs more than the whole check
+        private = cast("Dict[str, Any]", self.__pydantic_private__)
+        cache: Optional[_LayerCache] = private["_cache"]
+        if cache is not None:
+            key = cache.key
+            if key[0] is layers and key[1] == len(layers) and key[2] == _layer_edits:
+                return cache
+
+        rows = [_layer_row(layer) for layer in layers]
+
+        # None becomes NaN in the float arrays
+        values = np.array(rows, dtype=np.float64).reshape(-1, len(_SOA_FIELDS) + 2)
+        values.flags.writeable = False
+        soa = {field: values[:, i] for i, field in enumerate(_SOA_FIELDS)}
+        soa["center"] = values[:, -2]
+        soa["depth"] = values[:, -1]
+
+        depths = [row[-1] for row in rows]
+        sorted_depths = None not in depths and all(
+            a <= b for a, b in zip(depths, depths[1:])
+        )
+
+        # get_layer_index can bisect the layer depths only when they are in order
+        cache = _LayerCache(
+            (layers, len(layers), _layer_edits), soa, depths if sorted_depths else []
+        )
+        private["_cache"] = cache
+        return cache
+
     def get_layer_index(self, depth: float) -> int:
         """Returns the index of the soil layer at a specified depth.
 
@@ -276,6 +373,11 @@ class SoilProfile(BaseModel):
         Returns:
             The index of the layer containing the specified depth
         """
+        bottoms = self._layer_cache().bottoms
+        if bottoms:
+            return min(bisect_left(bottoms, depth), len(bottoms) - 1)
+
+        # Some layer depths are missing or out of order
         for i, layer in enumerate(self.layers):
             if layer.depth is not None and layer.depth >= depth:
                 return i
@@ -293,57 +395,165 @@ class SoilProfile(BaseModel):
         index = self.get_layer_index(depth)
         return self.layers[index]
 
-    def calc_normal_stress(self, depth: float) -> float:
-        """Calculates the total (normal) stress at a given depth.
+    def layer_soa(self) -> Dict[str, np.ndarray]:
+        """Returns the layer fields kept as arrays, one item per layer.
+
+        The arrays are read-only and are rebuilt after a layer is added to the
+        list or a layer field is changed.
+
+        Returns:
+            A dict mapping "center", "depth" and each field in `_SOA_FIELDS` to a
+            float array, NaN where the field is not set
+        """
+        return self._layer_cache().soa
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        """Returns the per-layer properties used in stress calculations as arrays.
+
+        The arrays are built once and cached until the layers change.
+
+        Returns:
+            A dict with "thickness", "top", "bottom", "dry_unit_weight" and
+            "saturated_unit_weight" arrays, one item per layer
+        """
+        cache = self._layer_cache()
+        if cache.arrays is None:
+            soa = cache.soa
+            thickness = soa["thickness"].copy()
+            bottom = np.cumsum(thickness)
+
+            cache.arrays = {
+                "thickness": thickness,
+                "top": bottom - thickness,
+                "bottom": bottom,
+                "dry_unit_weight": np.nan_to_num(soa["dry_unit_weight"], nan=0.0),
+                "saturated_unit_weight": np.nan_to_num(
+                    soa["saturated_unit_weight"], nan=0.0
+                ),
+            }
+
+        return cache.arrays
+
+    def calc_stresses(self, depth: float) -> Tuple[float, float]:
+        """Calculates the total and effective stress at a given depth in one pass.
 
         Args:
-            depth: The depth at which to calculate total stress
+            depth: The depth at which to calculate the stresses
 
         Returns:
-            The total normal stress (t/m²) at the specified depth
+            The total normal stress and the effective stress (t/m²) at the
+            specified depth
         """
         if self.ground_water_level is None:
             raise ValueError("Ground water level must be set")
 
-        layer_index = self.get_layer_index(depth)
-        total_stress = 0.0
-        previous_depth = 0.0
+        arrays = self._arrays()
         gwt = self.ground_water_level
 
-        for i, layer in enumerate(self.layers[: layer_index + 1]):
-            if layer.thickness is None:
-                raise ValueError("Layer thickness must be set")
-
-            layer_thickness = (
-                depth - previous_depth if i == layer_index else layer.thickness
+        if HAS_NUMBA:
+            normal_stress = _calc_normal_stress_kernel(
+                arrays["thickness"],
+                arrays["dry_unit_weight"],
+                arrays["saturated_unit_weight"],
+                gwt,
+                depth,
             )
+        else:
+            normal_stress = self._calc_normal_stress_numpy(arrays, gwt, depth)
 
-            dry_unit_weight = layer.dry_unit_weight or 0.0
-            saturated_unit_weight = layer.saturated_unit_weight or 0.0
+        if gwt >= depth:
+            # Effective stress equals total stress above water table
+            return normal_stress, normal_stress
 
-            if dry_unit_weight <= 1.0 and saturated_unit_weight <= 1.0:
-                raise ValueError(
-                    "Dry or saturated unit weight must be greater than 1 for each layer."
-                )
+        pore_pressure = (depth - gwt) * 0.981  # t/m³ for water
+        return normal_stress, normal_stress - pore_pressure
 
-            if gwt >= previous_depth + layer_thickness:
-                # Entirely above groundwater table (dry unit weight applies)
-                total_stress += dry_unit_weight * layer_thickness
-            elif gwt <= previous_depth:
-                # Entirely below groundwater table (saturated unit weight applies)
-                total_stress += saturated_unit_weight * layer_thickness
-            else:
-                # Partially submerged (both dry and saturated weights apply)
-                dry_thickness = gwt - previous_depth
-                submerged_thickness = layer_thickness - dry_thickness
-                total_stress += (
-                    dry_unit_weight * dry_thickness
-                    + saturated_unit_weight * submerged_thickness
+    def _calc_normal_stress_numpy(
+        self, arrays: Dict[str, np.ndarray], gwt: float, depth: float
+    ) -> float:
+        """Sums up the total stress down to the given depth with numpy.
+
+        Args:
+            arrays: The cached layer arrays from `_arrays`
+            gwt: Depth of the groundwater table in meters
+            depth: The depth at which to calculate total stress
+
+        Returns:
+            The total normal stress (t/m²) at the specified depth
+        """
+        n = self.get_layer_index(depth) + 1
+        if n == 0:
+            return 0.0
+        if n < _NUMPY_MIN_LAYERS:
+            return float(
+                _calc_normal_stress_kernel(
+                    arrays["thickness"],
+                    arrays["dry_unit_weight"],
+                    arrays["saturated_unit_weight"],
+                    gwt,
+                    depth,
                 )
+            )
+
+        dry_unit_weight = arrays["dry_unit_weight"][:n]
+        saturated_unit_weight = arrays["saturated_unit_weight"][:n]
+
+        if np.any((dry_unit_weight <= 1.0) & (saturated_unit_weight <= 1.0)):
+            raise ValueError(
+                "Dry or saturated unit weight must be greater than 1 for each layer."
+            )
+
+        top = arrays["top"][:n]
+        # The last layer is cut at the requested depth (or extended below the profile)
+        bottom = arrays["bottom"][:n].copy()
+        bottom[-1] = depth
+
+        # Split each layer into the parts above and below the groundwater table
+        dry_thickness = np.clip(gwt, top, bottom) - top
+        submerged_thickness = (bottom - top) - dry_thickness
+
+        return float(
+            np.sum(
+                dry_unit_weight * dry_thickness
+                + saturated_unit_weight * submerged_thickness
+            )
+        )
 
-            previous_depth += layer_thickness
+    def calc_normal_stress(self, depth: float) -> float:
+        """Calculates the total (normal) stress at a given depth.
 
-        return total_stress
+        Args:
+            depth: The depth at which to calculate total stress
+
+        Returns:
+            The total normal stress (t/m²) at the specified depth
+        """
+        return self.calc_stresses(depth)[0]
+
+    def normal_stress_at(self, depth: float) -> float:
+        """Returns the total (normal) stress at a given depth, memoized by depth.
+
+        Meant for a fixed depth such as the foundation depth that is queried again
+        and again, e.g. when scanning foundation pressures on the same profile.
+        Depths are quantized to 1e-6 m and the last 8 depths are kept.
+
+        Args:
+            depth: The depth at which to calculate total stress
+
+        Returns:
+            The total normal stress (t/m²) at the specified depth
+        """
+        # Dropped along with the layer arrays when the layers change
+        cache = self._layer_cache().normal_stress
+        key = (self.ground_water_level, round(depth * 1e6))
+        normal_stress = cache.get(key)
+        if normal_stress is None:
+            normal_stress = self.calc_normal_stress(depth)
+            if len(cache) >= _NORMAL_STRESS_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = normal_stress
+
+        return normal_stress
 
     def calc_effective_stress(self, depth: float) -> float:
         """Calculates the effective stress at a given depth.
@@ -354,18 +564,164 @@ class SoilProfile(BaseModel):
         Returns:
             The effective stress (t/m²) at the specified depth
         """
+        return self.calc_stresses(depth)[1]
+
+    def calc_effective_stress_batch(self, depths: np.ndarray) -> np.ndarray:
+        """Calculates the effective stress at several depths in a single pass.
+
+        Args:
+            depths: The depths at which to calculate effective stress
+
+        Returns:
+            The effective stresses (t/m²) at the specified depths
+        """
         if self.ground_water_level is None:
             raise ValueError("Ground water level must be set")
 
-        normal_stress = self.calc_normal_stress(depth)
+        depths = np.asarray(depths, dtype=np.float64)
+        if not self.layers or depths.size == 0:
+            return np.zeros_like(depths)
 
-        if self.ground_water_level >= depth:
-            return (
-                normal_stress  # Effective stress equals total stress above water table
+        arrays = self._arrays()
+        gwt = self.ground_water_level
+        top = arrays["top"]
+        bottom = arrays["bottom"]
+        dry_unit_weight = arrays["dry_unit_weight"]
+        saturated_unit_weight = arrays["saturated_unit_weight"]
+
+        # Same lookup as get_layer_index, for all depths at once
+        layer_indices = np.minimum(
+            np.searchsorted(bottom, depths, side="left"), len(self.layers) - 1
+        )
+
+        invalid = (dry_unit_weight <= 1.0) & (saturated_unit_weight <= 1.0)
+        if np.any(invalid[: layer_indices.max() + 1]):
+            raise ValueError(
+                "Dry or saturated unit weight must be greater than 1 for each layer."
+            )
+
+        # Rows are depths, columns are layers. Layers above the one containing the
+        # depth are taken whole, that layer is cut at the depth and the ones below
+        # get zero thickness.
+        columns = np.arange(len(self.layers))[None, :]
+        rows = layer_indices[:, None]
+        cut_bottom = np.where(columns < rows, bottom[None, :], depths[:, None])
+        cut_bottom = np.where(columns > rows, top[None, :], cut_bottom)
+
+        dry_bottom = np.clip(gwt, top[None, :], cut_bottom)
+        normal_stress = np.sum(
+            dry_unit_weight * (dry_bottom - top)
+            + saturated_unit_weight * (cut_bottom - dry_bottom),
+            axis=1,
+        )
+        pore_pressure = np.maximum(depths - gwt, 0.0) * 0.981
+        effective_stress: np.ndarray = normal_stress - pore_pressure
+
+        return effective_stress
+
+    def precompute_effective_stress_array(self) -> np.ndarray:
+        """Calculates the effective stress at the center of every layer.
+
+        All centers are done in one pass, by carrying the total stress at the layer
+        tops down the profile. The result is cached until the layers or the
+        groundwater level change.
+
+        Returns:
+            The effective stresses (t/m²) at the layer centers, one item per layer
+        """
+        if self.ground_water_level is None:
+            raise ValueError("Ground water level must be set")
+
+        gwt = self.ground_water_level
+        cache = self._layer_cache()
+        if cache.sigma_eff_centers is not None and cache.sigma_eff_centers[0] == gwt:
+            return cache.sigma_eff_centers[1]
+
+        arrays = self._arrays()
+        thickness = arrays["thickness"]
+        top = arrays["top"]
+        bottom = arrays["bottom"]
+        dry_unit_weight = arrays["dry_unit_weight"]
+        saturated_unit_weight = arrays["saturated_unit_weight"]
+
+        if np.any((dry_unit_weight <= 1.0) & (saturated_unit_weight <= 1.0)):
+            raise ValueError(
+                "Dry or saturated unit weight must be greater than 1 for each layer."
             )
-        else:
-            pore_pressure = (depth - self.ground_water_level) * 0.981  # t/m³ for water
-            return normal_stress - pore_pressure
+
+        # Total stress at the top of each layer
+        dry_bottom = np.clip(gwt, top, bottom)
+        layer_stress = dry_unit_weight * (dry_bottom - top) + saturated_unit_weight * (
+            bottom - dry_bottom
+        )
+        top_stress = np.concatenate(([0.0], np.cumsum(layer_stress)[:-1]))
+
+        # Plus the upper half of the layer itself
+        centers = top + thickness / 2.0
+        dry_bottom = np.clip(gwt, top, centers)
+        normal_stress = (
+            top_stress
+            + dry_unit_weight * (dry_bottom - top)
+            + saturated_unit_weight * (centers - dry_bottom)
+        )
+        effective_stress: np.ndarray = (
+            normal_stress - np.maximum(centers - gwt, 0.0) * 0.981
+        )
+
+        cache.sigma_eff_centers = (gwt, effective_stress)
+        return effective_stress
+
+    def to_soa(self, fields: List[str]) -> Dict[str, np.ndarray]:
+        """Returns the given layer fields as arrays, one item per layer.
+
+        Args:
+            fields: A list of SoilLayer field names
+
+        Returns:
+            A dict mapping each field name to a float array, NaN where the field
+            is not set
+        """
+        return {
+            field: np.array(
+                [getattr(layer, field) for layer in self.layers], dtype=np.float64
+            )
+            for field in fields
+        }
+
+    def _layer_fields_valid(self, fields: List[str]) -> bool:
+        """Checks the given fields of all layers against their bounds at once.
+
+        Args:
+            fields: A list of field names to check
+
+        Returns:
+            True if every layer passes `SoilLayer.validate_fields`, False if at least
+            one layer may not
+        """
+        if any(field not in _SOIL_FIELD_BOUNDS for field in fields):
+            return False
+
+        for field, values in self.to_soa(fields).items():
+            min_val, max_val = _SOIL_FIELD_BOUNDS[field]
+            if HAS_NUMBA:
+                status = _check_bounds(
+                    values,
+                    -np.inf if min_val is None else min_val,
+                    np.inf if max_val is None else max_val,
+                )
+                if status != _BOUNDS_OK:
+                    return False
+                continue
+
+            invalid = np.isnan(values)
+            if min_val is not None:
+                invalid |= values < min_val
+            if max_val is not None:
+                invalid |= values > max_val
+            if invalid.any():
+                return False
+
+        return True
 
     def validate(self, fields: List[str]) -> None:
         """Validates the soil profile and its layers.
@@ -382,8 +738,10 @@ class SoilProfile(BaseModel):
                 message="Soil profile must contain at least one layer.",
             )
 
-        for layer in self.layers:
-            layer.validate_fields(fields)
+        if not self._layer_fields_valid(fields):
+            # Walk the layers to raise the same error as validating them one by one
+            for layer in self.layers:
+                layer.validate_fields(fields)
 
         validate_field(
             "ground_water_level",
@@ -1,34 +1,143 @@
 """SPT (Standard Penetration Test) model for SoilPy."""
 
 import math
+from bisect import bisect_left
 from enum import Enum
-from typing import List, Optional, Union
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+import numpy as np
+from pydantic import BaseModel, Field, GetCoreSchemaHandler, PrivateAttr
+from pydantic_core import core_schema
 
 from ..enums import SelectionMethod
 from ..validation import ValidationError, validate_field
 
+# Module-level aliases avoid the math attribute lookup in per-blow calculations
+_sqrt = math.sqrt
+_ceil = math.ceil
+_exp = math.exp
 
-class NValue(BaseModel):
+# Integer stored for refusals, outside of the i32 range of regular N-values
+_REFUSAL = -(2**31) - 1
+
+
+def _raw_mul(v: int, factor: float) -> int:
+    """Multiplies a raw N-value by a factor, rounding up (refusal stays refusal)."""
+    return v if v == _REFUSAL else _ceil(v * factor)
+
+
+def _raw_add(v: int, other: float) -> int:
+    """Adds a float to a raw N-value, rounding up (refusal stays refusal)."""
+    return v if v == _REFUSAL else _ceil(v + other)
+
+
+# Bumped whenever a blow depth or N-value changes or blows are added, SPT keys its
+# idealization cache on it
+_blow_edits = 0
+
+
+def _bump_blow_edits() -> None:
+    """Marks the idealized experiment of every SPT as possibly stale."""
+    global _blow_edits
+    _blow_edits += 1
+
+
+def _blow_pairs(exps: List["SPTExp"]) -> List[Tuple[float, int]]:
+    """Returns the raw (depth, N) pairs of all blows that have both set.
+
+    Args:
+        exps: The experiments to read
+
+    Returns:
+        The pairs in experiment and blow order
+    """
+    return [
+        (blow.depth, blow.n._v)
+        for exp in exps
+        for blow in exp.blows
+        if blow.depth is not None and blow.n is not None
+    ]
+
+
+class NValue:
     """Represents an N-value that can be either a numeric value or refusal."""
 
-    value: Union[int, str] = Field(
-        ..., description="N-value as integer or 'R' for refusal"
-    )
+    __slots__ = ("_v",)
+
+    def __init__(self, value: Union[int, str]) -> None:
+        """Creates a new NValue.
+
+        Args:
+            value: N-value as integer or 'R' for refusal
+
+        Raises:
+            ValueError: If the value is neither an int nor 'R'
+        """
+        self._v = self._parse(value)
+
+    @staticmethod
+    def _parse(value: Union[int, float, str]) -> int:
+        """Converts an N-value to its raw int, accepting whole floats like 10.0."""
+        if isinstance(value, str) and (value.upper() == "R" or value == "Refusal"):
+            return _REFUSAL
+        if isinstance(value, int):
+            return value
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        raise ValueError("Invalid N-value")
+
+    @property
+    def value(self) -> Union[int, str]:
+        """N-value as integer or 'R' for refusal."""
+        v = self._v
+        return "R" if v == _REFUSAL else v
+
+    @value.setter
+    def value(self, value: Union[int, float, str]) -> None:
+        self._v = self._parse(value)
+        _bump_blow_edits()
+
+    def model_dump(self) -> Dict[str, Union[int, str]]:
+        """Returns the N-value as a dictionary, e.g. {"value": 10}."""
+        return {"value": self.value}
 
-    @field_validator("value")
     @classmethod
-    def validate_value(cls, v):
-        """Validate that value is either an int or 'R'."""
-        if isinstance(v, str) and v.upper() == "R":
-            return "R"
-        elif isinstance(v, str) and v == "Refusal":
-            return "R"
-        elif isinstance(v, int):
-            return v
-        else:
-            raise ValueError("Invalid N-value")
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Lets pydantic models hold NValue fields, (de)serialized as {"value": ...}."""
+        from_dict = core_schema.no_info_after_validator_function(
+            lambda data: cls(data["value"]),
+            core_schema.typed_dict_schema(
+                {
+                    "value": core_schema.typed_dict_field(
+                        core_schema.union_schema(
+                            [
+                                core_schema.int_schema(),
+                                core_schema.str_schema(),
+                            ]
+                        )
+                    )
+                }
+            ),
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=from_dict,
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), from_dict]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda n: {"value": n.value}
+            ),
+        )
+
+    @classmethod
+    def _from_raw(cls, v: int) -> "NValue":
+        """Wraps an already checked raw value, which may be the refusal marker."""
+        n = object.__new__(cls)
+        n._v = v
+        return n
 
     @classmethod
     def from_i32(cls, n: int) -> "NValue":
@@ -39,54 +148,53 @@ class NValue(BaseModel):
 
     def to_i32(self) -> int:
         """Converts to int (50 for refusals)."""
-        if self.value == "R":
-            return 50
-        return self.value
+        v = self._v
+        return 50 if v == _REFUSAL else v
 
     def to_option(self) -> Optional[int]:
         """Converts to Optional[int], treating Refusal as 50."""
-        if self.value == "R":
-            return 50
-        return self.value
+        v = self._v
+        return 50 if v == _REFUSAL else v
 
     def mul_by_f64(self, factor: float) -> "NValue":
         """Multiply by a factor."""
-        if self.value == "R":
-            return NValue(value="R")
-        return NValue(value=int(math.ceil(self.value * factor)))
+        return NValue._from_raw(_raw_mul(self._v, factor))
 
     def sum_with(self, other: "NValue") -> "NValue":
         """Sum up with another NValue."""
-        if self.value == "R" or other.value == "R":
+        a = self._v
+        b = other._v
+        if a == _REFUSAL or b == _REFUSAL:
             return NValue(value="R")
-        return NValue(value=self.value + other.value)
+        return NValue(value=a + b)
 
     def add_f64(self, other: float) -> "NValue":
         """Sum up with a float."""
-        if self.value == "R":
-            return NValue(value="R")
-        return NValue(value=int(math.ceil(self.value + other)))
+        return NValue._from_raw(_raw_add(self._v, other))
 
     def __str__(self) -> str:
-        if self.value == "R":
-            return "R"
-        return str(self.value)
+        v = self._v
+        return "R" if v == _REFUSAL else str(v)
+
+    def __repr__(self) -> str:
+        return f"NValue(value={self.value!r})"
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, NValue):
             return False
-        return self.value == other.value
+        return self._v == other._v
 
     def __lt__(self, other) -> bool:
         if not isinstance(other, NValue):
             return NotImplemented
-        if self.value == "R" and other.value == "R":
-            return False
-        if self.value == "R":
+        # Refusal ranks above every numeric value
+        a = self._v
+        b = other._v
+        if a == _REFUSAL:
             return False
-        if other.value == "R":
+        if b == _REFUSAL:
             return True
-        return self.value < other.value
+        return a < b
 
     def __le__(self, other) -> bool:
         return self < other or self == other
@@ -98,6 +206,35 @@ class NValue(BaseModel):
         return not self < other
 
 
+# Validation bounds (min, max) of the SPTBlow fields, None means unbounded
+_SPT_BLOW_FIELD_BOUNDS: Dict[str, Tuple[Optional[float], Optional[float]]] = {
+    "depth": (0.0, None),
+    "thickness": (0.0, None),
+    "n": (1, None),
+    "n60": (1, None),
+}
+
+# Labels used in the "missing" errors of the NValue fields
+_SPT_BLOW_NVALUE_LABELS: Dict[str, str] = {
+    "n": "N",
+    "n60": "N60",
+}
+
+# SPTBlow fields read by SPT.get_idealized_exp
+_IDEALIZED_FIELDS = frozenset(("depth", "n"))
+
+# Sets a field past SPTBlow.__setattr__; the corrections write other fields only
+# and this keeps the check out of their per-blow loops
+_set_field = BaseModel.__setattr__
+
+# Rod length correction factor: depths up to and including each threshold get the
+# matching value, deeper blows get the last one
+_CR_THRESH = (4.0, 6.0, 10.0)
+_CR_VALS = (0.75, 0.85, 0.95, 1.0)
+_CR_THRESH_ARR = np.array(_CR_THRESH)
+_CR_VALS_ARR = np.array(_CR_VALS)
+
+
 class SPTBlow(BaseModel):
     """Represents a single SPT blow."""
 
@@ -126,6 +263,12 @@ class SPTBlow(BaseModel):
         """
         return cls(depth=depth, n=n)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Sets a field and marks the idealized experiments as stale if needed."""
+        if name in _IDEALIZED_FIELDS and self.__dict__.get(name) != value:
+            _bump_blow_edits()
+        super().__setattr__(name, value)
+
     def validate(self, fields: List[str]) -> None:
         """Validates specific fields of the SPTBlow using field names.
 
@@ -136,31 +279,25 @@ class SPTBlow(BaseModel):
             ValidationError: If any field is invalid
         """
         for field in fields:
-            if field == "depth":
-                validate_field("depth", self.depth, 0.0, error_code_prefix="spt")
-            elif field == "thickness":
-                validate_field(
-                    "thickness", self.thickness, 0.0, error_code_prefix="spt"
-                )
-            elif field == "n":
-                if self.n is None:
-                    raise ValidationError(
-                        code="spt.n.missing", message="N value is missing in SptBlow"
-                    )
-                validate_field("n", self.n.to_i32(), 1, error_code_prefix="spt")
-            elif field == "n60":
-                if self.n60 is None:
-                    raise ValidationError(
-                        code="spt.n60.missing",
-                        message="N60 value is missing in SptBlow",
-                    )
-                validate_field("n60", self.n60.to_i32(), 1, error_code_prefix="spt")
-            else:
+            bounds = _SPT_BLOW_FIELD_BOUNDS.get(field)
+            if bounds is None:
                 raise ValidationError(
                     code="spt.invalid_field",
                     message=f"Field '{field}' is not valid for SPT.",
                 )
 
+            value = getattr(self, field)
+            if field in _SPT_BLOW_NVALUE_LABELS:
+                if value is None:
+                    raise ValidationError(
+                        code=f"spt.{field}.missing",
+                        message=f"{_SPT_BLOW_NVALUE_LABELS[field]} value is missing in SptBlow",
+                    )
+                value = value.to_i32()
+
+            min_val, max_val = bounds
+            validate_field(field, value, min_val, max_val, error_code_prefix="spt")
+
     def apply_energy_correction(self, energy_correction_factor: float) -> None:
         """Apply energy correction.
 
@@ -168,9 +305,9 @@ class SPTBlow(BaseModel):
             energy_correction_factor: Energy correction factor to convert N value to N60
         """
         if self.n is not None:
-            n60 = self.n.mul_by_f64(energy_correction_factor)
-            self.n60 = n60
-            self.n90 = n60.mul_by_f64(1.5)
+            n60 = _raw_mul(self.n._v, energy_correction_factor)
+            _set_field(self, "n60", NValue._from_raw(n60))
+            _set_field(self, "n90", NValue._from_raw(_raw_mul(n60, 1.5)))
 
     def set_cn(self, sigma_effective: float) -> None:
         """Set overburden correction factor.
@@ -178,20 +315,14 @@ class SPTBlow(BaseModel):
         Args:
             sigma_effective: Effective overburden pressure in ton
         """
-        self.cn = min(math.sqrt(1.0 / (9.81 * sigma_effective)) * 9.78, 1.7)
+        self.cn = min(_sqrt(1.0 / (9.81 * sigma_effective)) * 9.78, 1.7)
 
     def set_cr(self) -> None:
         """Set rod length correction factor."""
         if self.depth is None:
             self.cr = 1.0
-        elif self.depth <= 4.0:
-            self.cr = 0.75
-        elif self.depth <= 6.0:
-            self.cr = 0.85
-        elif self.depth <= 10.0:
-            self.cr = 0.95
         else:
-            self.cr = 1.0
+            self.cr = _CR_VALS[bisect_left(_CR_THRESH, self.depth)]
 
     def set_alpha_beta(self, fine_content: float) -> None:
         """Set alpha and beta factors.
@@ -200,14 +331,16 @@ class SPTBlow(BaseModel):
             fine_content: Percentage of fine content in soil in percentage
         """
         if fine_content <= 5.0:
-            self.alpha = 0.0
-            self.beta = 1.0
+            alpha = 0.0
+            beta = 1.0
         elif fine_content <= 35.0:
-            self.alpha = math.exp(1.76 - (190.0 / (fine_content**2)))
-            self.beta = 0.99 + (fine_content**1.5) / 1000.0
+            alpha = _exp(1.76 - (190.0 / (fine_content**2)))
+            beta = 0.99 + (fine_content**1.5) / 1000.0
         else:
-            self.alpha = 5.0
-            self.beta = 1.2
+            alpha = 5.0
+            beta = 1.2
+        _set_field(self, "alpha", alpha)
+        _set_field(self, "beta", beta)
 
     def apply_corrections(self, soil_profile, cs: float, cb: float, ce: float) -> None:
         """Apply corrections.
@@ -225,15 +358,31 @@ class SPTBlow(BaseModel):
         self.set_cr()
         if self.depth is not None:
             layer = soil_profile.get_layer_at_depth(self.depth)
-            fine_content = layer.fine_content or 0.0
-            self.set_alpha_beta(fine_content)
+            self.set_alpha_beta(layer.fine_content or 0.0)
 
-        if all(
-            x is not None for x in [self.n60, self.cn, self.cr, self.alpha, self.beta]
+        self._apply_n1_60(cs, cb)
+
+    def _apply_n1_60(self, cs: float, cb: float) -> None:
+        """Calculate N1_60 and N1_60f from the correction factors already set.
+
+        Args:
+            cs: sampler correction factor
+            cb: borehole diameter correction factor
+        """
+        n60, cn, cr, alpha, beta = self.n60, self.cn, self.cr, self.alpha, self.beta
+        if (
+            n60 is not None
+            and cn is not None
+            and cr is not None
+            and alpha is not None
+            and beta is not None
         ):
-            n1_60 = self.n60.mul_by_f64(self.cn * self.cr * cs * cb)
-            self.n1_60 = n1_60
-            self.n1_60f = n1_60.mul_by_f64(self.beta).add_f64(self.alpha)
+            # Work on the raw values and only wrap the results that are stored
+            n1_60 = _raw_mul(n60._v, cn * cr * cs * cb)
+            _set_field(self, "n1_60", NValue._from_raw(n1_60))
+            _set_field(
+                self, "n1_60f", NValue._from_raw(_raw_add(_raw_mul(n1_60, beta), alpha))
+            )
 
 
 class SPTExp(BaseModel):
@@ -255,6 +404,60 @@ class SPTExp(BaseModel):
         """
         return cls(blows=blows, name=name)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Sets a field and marks the idealized experiments as stale on new blows."""
+        if name == "blows":
+            _bump_blow_edits()
+        super().__setattr__(name, value)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        depths: np.ndarray,
+        n_values: np.ndarray,
+        refusal_mask: Optional[np.ndarray] = None,
+        name: str = "",
+    ) -> "SPTExp":
+        """Create a new SPTExp from blow arrays, the inverse of `n_array`.
+
+        The inputs are checked once as arrays, so the blows and their N-values are
+        built without per-blow validation.
+
+        Args:
+            depths: Depths of the blows
+            n_values: Integer N-values of the blows, ignored where refused
+            refusal_mask: Whether each blow is a refusal, none by default
+            name: Name of the experiment
+
+        Returns:
+            A new SPTExp instance
+
+        Raises:
+            ValueError: If the array lengths differ or an N-value is not an integer
+        """
+        depths = np.asarray(depths, dtype=np.float64)
+        n_values = np.asarray(n_values)
+        if refusal_mask is None:
+            refusal_mask = np.zeros(len(depths), dtype=bool)
+        else:
+            refusal_mask = np.asarray(refusal_mask, dtype=bool)
+
+        if not (depths.shape == n_values.shape == refusal_mask.shape):
+            raise ValueError(
+                "depths, n_values and refusal_mask must have the same length"
+            )
+        if n_values.dtype.kind != "i" and np.any(
+            n_values[~refusal_mask] != np.floor(n_values[~refusal_mask])
+        ):
+            raise ValueError("Invalid N-value")
+
+        raw = np.where(refusal_mask, _REFUSAL, n_values).astype(np.int64)
+        blows = [
+            SPTBlow.model_construct(depth=depth, n=NValue._from_raw(v))
+            for depth, v in zip(depths.tolist(), raw.tolist())
+        ]
+        return cls.model_construct(blows=blows, name=name)
+
     def apply_energy_correction(self, energy_correction_factor: float) -> None:
         """Apply energy correction.
 
@@ -272,6 +475,31 @@ class SPTExp(BaseModel):
             n: N-value of the blow
         """
         self.blows.append(SPTBlow.new(depth, n))
+        _bump_blow_edits()
+
+    def depth_array(self) -> np.ndarray:
+        """Returns the depths of the blows as a float array, NaN where not set."""
+        return np.array([blow.depth for blow in self.blows], dtype=np.float64)
+
+    def n_array(self, field: str = "n60") -> np.ndarray:
+        """Returns an N-value field of the blows as a float array.
+
+        The arrays are built on each call, as the corrections update the blows in
+        place.
+
+        Args:
+            field: Name of the NValue field of SPTBlow, e.g. "n" or "n60"
+
+        Returns:
+            The N-values with refusals as 50, like `NValue.to_i32`, and NaN where
+            the value is not set
+        """
+        values = np.array(
+            [np.nan if n is None else n._v for n in map(attrgetter(field), self.blows)],
+            dtype=np.float64,
+        )
+        values[values == _REFUSAL] = 50.0
+        return values
 
     def calc_thicknesses(self) -> None:
         """Calculate the thickness of each blow."""
@@ -290,8 +518,68 @@ class SPTExp(BaseModel):
             cb: borehole diameter correction factor
             ce: energy correction factor
         """
-        for blow in self.blows:
-            blow.apply_corrections(soil_profile, cs, cb, ce)
+        self.apply_energy_correction(ce)
+
+        fine_content: List[Optional[float]] = [None] * len(self.blows)
+        indices = [i for i, blow in enumerate(self.blows) if blow.depth is not None]
+
+        if indices:
+            depths = np.array([self.blows[i].depth for i in indices], dtype=np.float64)
+            self._apply_cn_batch(
+                indices, soil_profile.calc_effective_stress_batch(depths)
+            )
+
+            # Walk the blows in depth order together with the layers, matching
+            # SoilProfile.get_layer_at_depth without a lookup per blow
+            layers = soil_profile.layers
+            last = len(layers) - 1
+            li = 0
+            by_depth = sorted(
+                (blow.depth, i)
+                for i, blow in enumerate(self.blows)
+                if blow.depth is not None
+            )
+            for depth, i in by_depth:
+                while li < last and (
+                    layers[li].depth is None or layers[li].depth < depth
+                ):
+                    li += 1
+                fine_content[i] = layers[li].fine_content or 0.0
+
+        self._apply_cr_batch()
+
+        for blow, fc in zip(self.blows, fine_content):
+            if fc is not None:
+                blow.set_alpha_beta(fc)
+            blow._apply_n1_60(cs, cb)
+
+    def _apply_cn_batch(self, indices: List[int], sigma_effective: np.ndarray) -> None:
+        """Set the overburden correction factor of several blows at once.
+
+        Args:
+            indices: Indices of the blows to update
+            sigma_effective: Effective overburden pressure in ton at each blow
+        """
+        if np.any(sigma_effective <= 0.0):
+            # Let SPTBlow.set_cn raise the same error as the per-blow path
+            for i, sigma in zip(indices, sigma_effective.tolist()):
+                self.blows[i].set_cn(sigma)
+            return
+
+        cn = np.minimum(np.sqrt(1.0 / (9.81 * sigma_effective)) * 9.78, 1.7)
+        for i, value in zip(indices, cn.tolist()):
+            _set_field(self.blows[i], "cn", value)
+
+    def _apply_cr_batch(self) -> None:
+        """Set the rod length correction factor of all blows at once."""
+        depths = np.array(
+            [np.nan if blow.depth is None else blow.depth for blow in self.blows],
+            dtype=np.float64,
+        )
+        # Blows without a depth sort past every threshold and get the last value
+        cr = _CR_VALS_ARR[np.searchsorted(_CR_THRESH_ARR, depths, side="left")]
+        for blow, value in zip(self.blows, cr.tolist()):
+            _set_field(blow, "cr", value)
 
     def validate(self, fields: List[str]) -> None:
         """Validates specific fields of the SPTExp using field names.
@@ -320,6 +608,22 @@ class SPT(BaseModel):
     sampler_correction_factor: Optional[float] = None
     idealization_method: SelectionMethod = SelectionMethod.AVG
 
+    # The exps list, the key (method, number of blows of each experiment,
+    # _blow_edits) and the raw (depth, N) pairs of the last idealization
+    _ideal_cache: Optional[
+        Tuple[
+            List[SPTExp],
+            Tuple[SelectionMethod, Tuple[int, ...], int],
+            List[Tuple[float, int]],
+        ]
+    ] = PrivateAttr(default=None)
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the fields only, the idealization cache is left out."""
+        if not isinstance(other, SPT):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
     @classmethod
     def new(
         cls,
@@ -363,53 +667,87 @@ class SPT(BaseModel):
             exp: SPTExp
         """
         self.exps.append(exp)
+        _bump_blow_edits()
 
     def get_idealized_exp(self, name: str) -> SPTExp:
         """Get the idealized experiment.
 
+        The selected (depth, N) pairs are reused while the idealization method,
+        the exps list and the number of blows in each experiment stay the same and
+        no blow depth or N-value was changed since; the check does not read the
+        blows. A fresh SPTExp is built on every call.
+
         Args:
             name: Name of the idealized experiment
 
         Returns:
             SPTExp: Idealized experiment
         """
+        exps = self.exps
+        # Blows appended to an experiment list directly change its length only
+        lengths = tuple([len(exp.blows) for exp in exps])
+        key = (self.idealization_method, lengths, _blow_edits)
+        private = cast("Dict[str, Any]", self.__pydantic_private__)
+        cached = private["_ideal_cache"]
+        if cached is None or cached[0] is not exps or cached[1] != key:
+            cached = (exps, key, self._idealize(_blow_pairs(exps)))
+            private["_ideal_cache"] = cached
+
+        # The values come from already validated blows, so skip validation;
+        # copying one constructed blow is cheaper than constructing each
+        template = SPTBlow.model_construct(depth=None, n=None)
+        idealized_blows = [
+            template.model_copy(update={"depth": depth, "n": NValue._from_raw(v)})
+            for depth, v in cached[2]
+        ]
+
+        return SPTExp.model_construct(blows=idealized_blows, name=name)
+
+    def _idealize(self, pairs: List[Tuple[float, int]]) -> List[Tuple[float, int]]:
+        """Selects one N value per depth over all experiments.
+
+        Args:
+            pairs: The raw (depth, N) pairs of all blows
+
+        Returns:
+            The raw (depth, N) pairs of the idealized experiment, sorted by depth
+        """
         mode = self.idealization_method
-        depth_map = {}
 
-        # Collect all unique depths and corresponding n values
-        for exp in self.exps:
-            for blow in exp.blows:
-                if blow.depth is not None and blow.n is not None:
-                    depth = blow.depth
-                    if depth not in depth_map:
-                        depth_map[depth] = []
-                    depth_map[depth].append(blow.n)
-
-        # Create a new SPTExp with selected values
-        idealized_blows = []
-
-        for depth, n_values in depth_map.items():
-            if mode == SelectionMethod.MIN:
-                selected_n = min(n_values)
-            elif mode == SelectionMethod.MAX:
-                selected_n = max(n_values)
-            else:  # AVG
-                sum_val = sum(n.to_option() or 0 for n in n_values)
-                count = len(n_values)
-                if count > 0:
-                    # Use math.ceil for values >= 0.5 to match Rust's round behavior
-                    avg_float = sum_val / count
-                    if avg_float - int(avg_float) >= 0.5:
-                        avg_val = int(avg_float) + 1
-                    else:
-                        avg_val = int(avg_float)
-                    selected_n = NValue.from_i32(avg_val)
-                else:
-                    selected_n = NValue.from_i32(0)
-
-            idealized_blows.append(SPTBlow(depth=depth, n=selected_n))
-
-        return SPTExp.new(idealized_blows, name)
+        if not pairs:
+            return []
+
+        depths = np.fromiter((p[0] for p in pairs), dtype=np.float64, count=len(pairs))
+        ns = np.fromiter((p[1] for p in pairs), dtype=np.int64, count=len(pairs))
+        is_refusal = ns == _REFUSAL
+
+        # Group the values by depth: sort them and find where each depth starts
+        order = np.argsort(depths, kind="stable")
+        depths = depths[order]
+        ns = ns[order]
+        is_refusal = is_refusal[order]
+        unique_depths, starts = np.unique(depths, return_index=True)
+
+        if mode == SelectionMethod.AVG:
+            values = np.where(is_refusal, 50, ns)
+            counts = np.diff(np.append(starts, len(ns)))
+            avg = np.add.reduceat(values, starts) / counts
+            # Round half up to match Rust's round behavior
+            whole = np.trunc(avg)
+            rounded = (whole + (avg - whole >= 0.5)).astype(np.int64)
+            # from_i32 rejects averages that round to zero or below
+            selected = [NValue.from_i32(v)._v for v in rounded.tolist()]
+        else:
+            # Refusal ranks above every numeric value
+            top_rank = np.iinfo(np.int64).max
+            ranks = np.where(is_refusal, top_rank, ns)
+            reduce = np.minimum if mode == SelectionMethod.MIN else np.maximum
+            selected = [
+                _REFUSAL if v == top_rank else v
+                for v in reduce.reduceat(ranks, starts).tolist()
+            ]
+
+        return list(zip(unique_depths.tolist(), selected))
 
     def validate(self, fields: List[str]) -> None:
         """Validates specific fields of the SPT using field names.
@@ -1,11 +1,14 @@
 """Swelling potential calculations for SoilPy."""
 
-from typing import List
+from typing import List, NoReturn, Optional
 
+import numpy as np
 from pydantic import BaseModel
 
+from soilpy._swelling_kernels import _compute, _compute_numpy
+from soilpy.helper import HAS_NUMBA
 from soilpy.models import Foundation, SoilProfile
-from soilpy.validation import ValidationError, validate_field
+from soilpy.validation import ValidationError, make_validator
 
 
 class SwellingPotentialData(BaseModel):
@@ -25,6 +28,11 @@ class SwellingPotentialResult(BaseModel):
     net_foundation_pressure: float  # The net foundation pressure in ton/m2
 
 
+_validate_foundation_pressure = make_validator(
+    "foundation_pressure", 0.0, error_code_prefix="loads"
+)
+
+
 def validate_input(
     soil_profile: SoilProfile,
     foundation: Foundation,
@@ -52,12 +60,26 @@ def validate_input(
     )
     foundation.validate(["foundation_depth", "foundation_width", "foundation_length"])
 
-    validate_field(
-        "foundation_pressure",
-        foundation_pressure,
-        0.0,
-        error_code_prefix="loads",
-    )
+    _validate_foundation_pressure(foundation_pressure)
+
+
+def _raise_missing_input(
+    water_content: Optional[float], liquid_limit: Optional[float]
+) -> NoReturn:
+    """Raises the error for the first missing input of the swelling pressure formula.
+
+    Args:
+        water_content: Water content of the layer
+        liquid_limit: Liquid limit of the layer
+
+    Raises:
+        ValueError: Always
+    """
+    if water_content is None:
+        raise ValueError("Water content must be set")
+    if liquid_limit is None:
+        raise ValueError("Liquid limit must be set")
+    raise ValueError("Dry unit weight must be set")
 
 
 def calc_swelling_potential(
@@ -93,59 +115,68 @@ def calc_swelling_potential(
     width = foundation.foundation_width
     length = foundation.foundation_length
 
-    net_foundation_pressure = foundation_pressure - soil_profile.calc_normal_stress(df)
+    net_foundation_pressure = foundation_pressure - soil_profile.normal_stress_at(df)
     vertical_load = net_foundation_pressure * width * length
 
-    data: List[SwellingPotentialData] = []
-
-    for layer in soil_profile.layers:
-        if layer.center is None:
-            raise ValueError("Layer center must be set")
-
-        z = layer.center
-        effective_stress = 0.0
-        delta_stress = 0.0
-
-        if z >= df:
-            effective_stress = soil_profile.calc_effective_stress(z)
-            delta_stress = vertical_load / ((width + z - df) * (length + z - df))
-
-        if layer.plastic_limit is not None:
-            if layer.water_content is None:
-                raise ValueError("Water content must be set")
-            if layer.liquid_limit is None:
-                raise ValueError("Liquid limit must be set")
-            if layer.dry_unit_weight is None:
-                raise ValueError("Dry unit weight must be set")
-
-            water_content = layer.water_content
-            liquid_limit = layer.liquid_limit
-            dry_unit_weight = layer.dry_unit_weight
-            plastic_limit = layer.plastic_limit
-
-            swelling_pressure = (
-                -3.08 * water_content
-                + 102.5 * dry_unit_weight
-                + 0.635 * liquid_limit
-                + 4.24 * plastic_limit
-                - 220.8
-            )
-        else:
-            swelling_pressure = 0.0
-
-        is_safe = swelling_pressure <= (effective_stress + delta_stress)
-
-        data.append(
-            SwellingPotentialData(
-                layer_center=layer.center,
-                effective_stress=effective_stress,
-                delta_stress=delta_stress,
-                swelling_pressure=swelling_pressure,
-                is_safe=is_safe,
-            )
+    # The layer fields are kept as arrays on the profile by calc_layer_depths
+    soa = soil_profile.layer_soa()
+    centers = soa["center"]
+    water_content = soa["water_content"]
+    liquid_limit = soa["liquid_limit"]
+    plastic_limit = soa["plastic_limit"]
+    dry_unit_weight = soa["dry_unit_weight"]
+
+    # Layers without a plastic limit are masked out of the swelling pressure
+    has_plastic = ~np.isnan(plastic_limit)
+    missing = has_plastic & (
+        np.isnan(water_content) | np.isnan(liquid_limit) | np.isnan(dry_unit_weight)
+    )
+    if missing.any():
+        layer = soil_profile.layers[int(np.argmax(missing))]
+        _raise_missing_input(layer.water_content, layer.liquid_limit)
+
+    # Only the layers below the foundation level are loaded
+    effective_stress = np.zeros(len(centers))
+    start = int(np.searchsorted(centers, df))
+    if start < len(centers):
+        effective_stress[start:] = soil_profile.precompute_effective_stress_array()[
+            start:
+        ]
+
+    compute = _compute if HAS_NUMBA else _compute_numpy
+    delta_stress, swelling_pressure, is_safe = compute(
+        centers,
+        effective_stress,
+        water_content,
+        liquid_limit,
+        plastic_limit,
+        dry_unit_weight,
+        has_plastic,
+        df,
+        width,
+        length,
+        vertical_load,
+    )
+
+    # The records are built from float arrays above, so skip re-validating each one
+    data = [
+        SwellingPotentialData.model_construct(
+            layer_center=z,
+            effective_stress=sigma,
+            delta_stress=delta,
+            swelling_pressure=pressure,
+            is_safe=safe,
+        )
+        for z, sigma, delta, pressure, safe in zip(
+            centers.tolist(),
+            effective_stress.tolist(),
+            delta_stress.tolist(),
+            swelling_pressure.tolist(),
+            is_safe.tolist(),
         )
+    ]
 
-    return SwellingPotentialResult(
+    return SwellingPotentialResult.model_construct(
         data=data,
         net_foundation_pressure=net_foundation_pressure,
     )
@@ -1,6 +1,6 @@
 """Validation module for SoilPy."""
 
-from typing import Optional, Union
+from typing import Callable, NoReturn, Optional, Union
 
 from pydantic import BaseModel
 
@@ -17,6 +17,38 @@ class ValidationError(Exception):
         return f"[{self.code}] {self.message}"
 
 
+# The error payloads are only built in these helpers, off the success path of
+# validate_field
+
+
+def _raise_missing(field_name: str, error_code_prefix: str) -> NoReturn:
+    """Raises the ValidationError for a field that is not set."""
+    raise ValidationError(
+        code=f"{error_code_prefix}.{field_name}.missing",
+        message=f"{field_name} must be provided.",
+    )
+
+
+def _raise_too_small(
+    field_name: str, min_val: Union[int, float], error_code_prefix: str
+) -> NoReturn:
+    """Raises the ValidationError for a value below the minimum."""
+    raise ValidationError(
+        code=f"{error_code_prefix}.{field_name}.too_small.{min_val}",
+        message=f"{field_name} must be greater than or equal to {min_val}.",
+    )
+
+
+def _raise_too_large(
+    field_name: str, max_val: Union[int, float], error_code_prefix: str
+) -> NoReturn:
+    """Raises the ValidationError for a value above the maximum."""
+    raise ValidationError(
+        code=f"{error_code_prefix}.{field_name}.too_large.{max_val}",
+        message=f"{field_name} must be less than or equal to {max_val}.",
+    )
+
+
 def validate_field(
     field_name: str,
     value: Optional[Union[int, float]],
@@ -37,19 +69,49 @@ def validate_field(
         ValidationError: If validation fails
     """
     if value is None:
-        raise ValidationError(
-            code=f"{error_code_prefix}.{field_name}.missing",
-            message=f"{field_name} must be provided.",
-        )
+        _raise_missing(field_name, error_code_prefix)
 
     if min_val is not None and value < min_val:
-        raise ValidationError(
-            code=f"{error_code_prefix}.{field_name}.too_small.{min_val}",
-            message=f"{field_name} must be greater than or equal to {min_val}.",
-        )
+        _raise_too_small(field_name, min_val, error_code_prefix)
 
     if max_val is not None and value > max_val:
-        raise ValidationError(
-            code=f"{error_code_prefix}.{field_name}.too_large.{max_val}",
-            message=f"{field_name} must be less than or equal to {max_val}.",
-        )
+        _raise_too_large(field_name, max_val, error_code_prefix)
+
+
+def make_validator(
+    field_name: str,
+    min_val: Optional[Union[int, float]] = None,
+    max_val: Optional[Union[int, float]] = None,
+    error_code_prefix: str = "validation",
+) -> Callable[[Optional[Union[int, float]]], None]:
+    """Builds a validator for one field with fixed bounds.
+
+    The returned function behaves like `validate_field` called with the same
+    arguments, but the error codes and messages are built once, up front.
+
+    Args:
+        field_name: A name for the field (e.g. "cu")
+        min_val: Optional minimum value (inclusive)
+        max_val: Optional maximum value (inclusive)
+        error_code_prefix: A short prefix for generating the error code, e.g., "layer"
+
+    Returns:
+        A function taking the value to validate and raising ValidationError if it
+        is invalid
+    """
+    missing_code = f"{error_code_prefix}.{field_name}.missing"
+    missing_message = f"{field_name} must be provided."
+    too_small_code = f"{error_code_prefix}.{field_name}.too_small.{min_val}"
+    too_small_message = f"{field_name} must be greater than or equal to {min_val}."
+    too_large_code = f"{error_code_prefix}.{field_name}.too_large.{max_val}"
+    too_large_message = f"{field_name} must be less than or equal to {max_val}."
+
+    def validator(value: Optional[Union[int, float]]) -> None:
+        if value is None:
+            raise ValidationError(code=missing_code, message=missing_message)
+        if min_val is not None and value < min_val:
+            raise ValidationError(code=too_small_code, message=too_small_message)
+        if max_val is not None and value > max_val:
+            raise ValidationError(code=too_large_code, message=too_large_message)
+
+    return validator
@@ -56,3 +56,19 @@ class TestFoundation:
         # Negative values should be prevented (width or length cannot be negative)
         assert foundation.effective_width == 0.0
         assert foundation.effective_length == 2.0  # The remaining length
+
+    def test_calc_effective_lengths_batch(self):
+        """Test that batched effective lengths match the single load case results."""
+        foundation = Foundation(
+            foundation_length=6.0,
+            foundation_width=3.0,
+        )
+        ex = [0.0, 1.0, 2.0]
+        ey = [0.0, 1.5, 2.0]
+
+        widths, lengths = foundation.calc_effective_lengths_batch(ex, ey)
+
+        for i in range(len(ex)):
+            foundation.calc_effective_lengths(ex[i], ey[i])
+            assert widths[i] == foundation.effective_width
+            assert lengths[i] == foundation.effective_length
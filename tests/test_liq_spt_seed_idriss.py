@@ -1,8 +1,13 @@
 """Tests for liquefaction SPT Seed-Idriss calculations."""
 
+import numpy as np
 import pytest
 
-from soilpy.liquefaction.spt.seed_idriss import calc_crr75, calc_settlement
+from soilpy.liquefaction.spt.seed_idriss import (
+    calc_crr75,
+    calc_crr75_array,
+    calc_settlement,
+)
 
 
 class TestLiquefactionSptSeedIdriss:
@@ -18,6 +23,16 @@ class TestLiquefactionSptSeedIdriss:
         result = calc_crr75(n1_60_f, effective_stress)
         assert abs(result - expected) < 1e-2
 
+    def test_calc_crr75_array(self):
+        """Test that batched CRR values match the single depth results."""
+        n1_60_f = np.array([5, 15, 25])
+        effective_stress = np.array([4.0, 8.0, 12.0])  # ton/m²
+
+        result = calc_crr75_array(n1_60_f, effective_stress)
+
+        for n, stress, crr in zip(n1_60_f, effective_stress, result):
+            assert abs(crr - calc_crr75(int(n), float(stress))) < 1e-9
+
     def test_calc_settlement(self):
         """Test settlement calculation due to liquefaction."""
         fs = 1.0
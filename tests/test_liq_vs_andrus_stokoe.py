@@ -8,24 +8,16 @@ from soilpy.liquefaction.vs.andrus_stokoe import calc_crr75, calc_settlement, ca
 class TestLiquefactionVsAndrusStokoe:
     """Test cases for liquefaction VS Andrus-Stokoe calculations."""
 
-    def test_calc_vs1c_low_fine_content(self):
-        """Test Vs1c calculation for low fine content (fc <= 5.0)."""
-        fine_content = 3.0
-        expected = 215.0
-        result = calc_vs1c(fine_content)
-        assert abs(result - expected) < 1e-6
-
-    def test_calc_vs1c_mid_fine_content(self):
-        """Test Vs1c calculation for mid fine content (5.0 < fc <= 35.0)."""
-        fine_content = 20.0
-        expected = 215.0 - 0.5 * (fine_content - 5.0)  # = 207.5
-        result = calc_vs1c(fine_content)
-        assert abs(result - expected) < 1e-6
-
-    def test_calc_vs1c_high_fine_content(self):
-        """Test Vs1c calculation for high fine content (fc > 35.0)."""
-        fine_content = 40.0
-        expected = 200.0
+    @pytest.mark.parametrize(
+        "fine_content,expected",
+        [
+            (3.0, 215.0),  # fc <= 5.0
+            (20.0, 207.5),  # 5.0 < fc <= 35.0: 215.0 - 0.5 * (fc - 5.0)
+            (40.0, 200.0),  # fc > 35.0
+        ],
+    )
+    def test_calc_vs1c(self, fine_content, expected):
+        """Test Vs1c calculation for each fine content range."""
         result = calc_vs1c(fine_content)
         assert abs(result - expected) < 1e-6
 
@@ -34,7 +34,21 @@ class TestLoads:
         assert ex == 0.0
         assert ey == 0.0
 
-    def test_get_vertical_stress(self):
+    @pytest.mark.parametrize(
+        "load_case,severity,expected",
+        [
+            (LoadCase.SERVICE_LOAD, SelectionMethod.MIN, 10.0),
+            (LoadCase.SERVICE_LOAD, SelectionMethod.AVG, 15.0),
+            (LoadCase.SERVICE_LOAD, SelectionMethod.MAX, 20.0),
+            (LoadCase.ULTIMATE_LOAD, SelectionMethod.MIN, 25.0),
+            (LoadCase.ULTIMATE_LOAD, SelectionMethod.AVG, 30.0),
+            (LoadCase.ULTIMATE_LOAD, SelectionMethod.MAX, 35.0),
+            (LoadCase.SEISMIC_LOAD, SelectionMethod.MIN, 40.0),
+            (LoadCase.SEISMIC_LOAD, SelectionMethod.AVG, 45.0),
+            (LoadCase.SEISMIC_LOAD, SelectionMethod.MAX, 0.0),  # missing value
+        ],
+    )
+    def test_get_vertical_stress(self, load_case, severity, expected):
         """Test vertical stress retrieval for different load cases and selection methods."""
         # Create a struct with known values
         stress_data = Loads(
@@ -55,17 +69,19 @@ class TestLoads:
             ),
         )
 
-        # Test Service Load
-        assert stress_data.get_vertical_stress(LoadCase.SERVICE_LOAD, SelectionMethod.MIN) == 10.0
-        assert stress_data.get_vertical_stress(LoadCase.SERVICE_LOAD, SelectionMethod.AVG) == 15.0
-        assert stress_data.get_vertical_stress(LoadCase.SERVICE_LOAD, SelectionMethod.MAX) == 20.0
+        assert stress_data.get_vertical_stress(load_case, severity) == expected
 
-        # Test Ultimate Load
-        assert stress_data.get_vertical_stress(LoadCase.ULTIMATE_LOAD, SelectionMethod.MIN) == 25.0
-        assert stress_data.get_vertical_stress(LoadCase.ULTIMATE_LOAD, SelectionMethod.AVG) == 30.0
-        assert stress_data.get_vertical_stress(LoadCase.ULTIMATE_LOAD, SelectionMethod.MAX) == 35.0
+    def test_get_vertical_stresses(self):
+        """Test that batched vertical stresses match the single lookups."""
+        stress_data = Loads(
+            service_load=Stress(min=10.0, avg=15.0, max=20.0),
+            seismic_load=Stress(min=40.0, avg=None, max=50.0),
+        )
+        load_cases = [case for case in LoadCase for _ in SelectionMethod]
+        load_severities = [method for _ in LoadCase for method in SelectionMethod]
+
+        result = stress_data.get_vertical_stresses(load_cases, load_severities)
 
-        # Test Seismic Load
-        assert stress_data.get_vertical_stress(LoadCase.SEISMIC_LOAD, SelectionMethod.MIN) == 40.0
-        assert stress_data.get_vertical_stress(LoadCase.SEISMIC_LOAD, SelectionMethod.AVG) == 45.0
-        assert stress_data.get_vertical_stress(LoadCase.SEISMIC_LOAD, SelectionMethod.MAX) == 0.0
+        assert len(result) == 9
+        for load_case, severity, stress in zip(load_cases, load_severities, result):
+            assert stress == stress_data.get_vertical_stress(load_case, severity)
@@ -2,7 +2,7 @@
 
 import pytest
 
-from soilpy.local_soil_class.by_cu import calc_lsc_by_cu
+from soilpy.local_soil_class.by_cu import calc_lsc_by_cu, compute_cu_30
 from soilpy.models.soil_profile import SoilLayer, SoilProfile
 
 
@@ -64,3 +64,15 @@ class TestLscByCu:
         assert len(result.layers) == 3
         assert abs(result.cu_30 - 17.14) < 1e-2  # harmonic average
         assert result.soil_class == "ZD"
+
+    def test_compute_cu_30_after_layer_edit(self):
+        """Test that an edited cu is used without recalculating the depths."""
+        profile = SoilProfile(
+            ground_water_level=0.0,
+            layers=[self.create_layer(5.0, 5.0)],
+        )
+        assert compute_cu_30(profile)[0].cu == 5.0
+
+        profile.layers[0].cu = 7.0
+
+        assert compute_cu_30(profile)[0].cu == 7.0
@@ -3,7 +3,7 @@
 import pytest
 
 from soilpy.enums import SelectionMethod
-from soilpy.local_soil_class.by_vs import calc_lsc_by_vs
+from soilpy.local_soil_class.by_vs import calc_lsc_by_vs, compute_vs_30
 from soilpy.models.masw import Masw, MaswExp, MaswLayer
 
 
@@ -82,3 +82,12 @@ class TestLscByVs:
         assert len(result.layers) == 3
         assert abs(result.vs_30 - 1714.28) < 1e-2  # harmonic average
         assert result.soil_class == "ZA"
+
+    def test_compute_vs_30_after_layer_edit(self):
+        """Test that an edited vs is used without recalculating the depths."""
+        exp = MaswExp.new([self.create_layer(5.0, 1000.0)], "Test exp")
+        assert compute_vs_30(exp)[0].vs == 1000.0
+
+        exp.layers[0].vs = 1200.0
+
+        assert compute_vs_30(exp)[0].vs == 1200.0
@@ -6,6 +6,36 @@ from soilpy.enums import SelectionMethod
 from soilpy.models.masw import Masw, MaswExp, MaswLayer
 
 
+@pytest.fixture(scope="class")
+def masw_data() -> Masw:
+    """Create test MASW data for idealization tests."""
+    exp1 = MaswExp.new(
+        [
+            MaswLayer.new(2.0, 180.0, 400.0),  # depth: 2.0
+            MaswLayer.new(3.0, 200.0, 450.0),  # depth: 5.0
+        ],
+        "Exp1",
+    )
+
+    exp2 = MaswExp.new(
+        [
+            MaswLayer.new(1.5, 170.0, 390.0),  # depth: 1.5
+            MaswLayer.new(4.0, 190.0, 430.0),  # depth: 5.5
+        ],
+        "Exp2",
+    )
+
+    exp3 = MaswExp.new(
+        [
+            MaswLayer.new(3.0, 160.0, 395.0),  # depth: 3.0
+            MaswLayer.new(3.0, 180.0, 420.0),  # depth: 6.0
+        ],
+        "Exp3",
+    )
+
+    return Masw.new([exp1, exp2, exp3], SelectionMethod.MIN)
+
+
 class TestMasw:
     """Test cases for MASW model methods."""
 
@@ -27,6 +57,20 @@ class TestMasw:
         assert masw_exp.layers[1].depth == 4.0
         assert masw_exp.layers[2].depth == 8.0
 
+    def test_layer_soa(self):
+        """Test the layer arrays built by calc_depths."""
+        layers = [
+            MaswLayer.new(1.5, 100.0, 200.0),
+            MaswLayer.new(2.5, 150.0, 300.0),
+        ]
+
+        soa = MaswExp.new(layers, "Test").layer_soa()
+
+        assert list(soa["thickness"]) == [1.5, 2.5]
+        assert list(soa["vs"]) == [100.0, 150.0]
+        assert list(soa["vp"]) == [200.0, 300.0]
+        assert list(soa["depth"]) == [1.5, 4.0]
+
     def test_calc_depths_invalid_thickness(self):
         """Test depth calculation with invalid thickness (should raise ValueError)."""
         layers = [
@@ -55,37 +99,10 @@ class TestMasw:
         layer = masw_exp.get_layer_at_depth(15.0)
         assert layer.vs == 3.0
 
-    def create_test_masw(self) -> Masw:
-        """Create test MASW data for idealization tests."""
-        exp1 = MaswExp.new(
-            [
-                MaswLayer.new(2.0, 180.0, 400.0),  # depth: 2.0
-                MaswLayer.new(3.0, 200.0, 450.0),  # depth: 5.0
-            ],
-            "Exp1",
-        )
-
-        exp2 = MaswExp.new(
-            [
-                MaswLayer.new(1.5, 170.0, 390.0),  # depth: 1.5
-                MaswLayer.new(4.0, 190.0, 430.0),  # depth: 5.5
-            ],
-            "Exp2",
-        )
-
-        exp3 = MaswExp.new(
-            [
-                MaswLayer.new(3.0, 160.0, 395.0),  # depth: 3.0
-                MaswLayer.new(3.0, 180.0, 420.0),  # depth: 6.0
-            ],
-            "Exp3",
-        )
-
-        return Masw.new([exp1, exp2, exp3], SelectionMethod.MIN)
-
-    def test_get_idealized_exp_min_mode(self):
+    def test_get_idealized_exp_min_mode(self, masw_data):
         """Test idealized experiment creation in MIN mode."""
-        masw = self.create_test_masw()
+        # Shallow copy, so setting the idealization method stays within the test
+        masw = masw_data.model_copy()
 
         ideal = masw.get_idealized_exp("Ideal_Min")
 
@@ -105,9 +122,10 @@ class TestMasw:
         last_layer = ideal.layers[-1]
         assert last_layer.depth == 6.0
 
-    def test_get_idealized_exp_avg_mode(self):
+    def test_get_idealized_exp_avg_mode(self, masw_data):
         """Test idealized experiment creation in AVG mode."""
-        masw = self.create_test_masw()
+        # Shallow copy, so setting the idealization method stays within the test
+        masw = masw_data.model_copy()
 
         masw.idealization_method = SelectionMethod.AVG
         ideal = masw.get_idealized_exp("Ideal_Avg")
@@ -128,9 +146,10 @@ class TestMasw:
         last_layer = ideal.layers[-1]
         assert last_layer.depth == 6.0
 
-    def test_get_idealized_exp_max_mode(self):
+    def test_get_idealized_exp_max_mode(self, masw_data):
         """Test idealized experiment creation in MAX mode."""
-        masw = self.create_test_masw()
+        # Shallow copy, so setting the idealization method stays within the test
+        masw = masw_data.model_copy()
 
         masw.idealization_method = SelectionMethod.MAX
         ideal = masw.get_idealized_exp("Ideal_Max")
@@ -14,13 +14,13 @@ from soilpy.models.point_load_test import PointLoadExp, PointLoadSample, PointLo
 class TestGetGeneralizedCValue:
     """Test cases for get_generalized_c_value function."""
 
-    def test_get_generalized_c_value(self):
+    @pytest.mark.parametrize(
+        "d,expected_c", [(10.0, 17.5), (30.0, 19.0), (45.0, 22.0), (65.0, 24.5)]
+    )
+    def test_get_generalized_c_value(self, d, expected_c):
         """Test cases for the generalized size correction factor C"""
-        test_cases = [(10.0, 17.5), (30.0, 19.0), (45.0, 22.0), (65.0, 24.5)]
-
-        for d, expected_c in test_cases:
-            c = get_generalized_c_value(d)
-            assert abs(c - expected_c) < 1e-10, f"Failed for d = {d}"
+        c = get_generalized_c_value(d)
+        assert abs(c - expected_c) < 1e-10
 
 
 class TestCalcBearingCapacity:
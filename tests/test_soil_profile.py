@@ -1,8 +1,11 @@
 """Tests for soil profile model functions."""
 
+import numpy as np
 import pytest
 
+import soilpy.models.soil_profile as soil_profile_module
 from soilpy.models import SoilLayer, SoilProfile
+from soilpy.validation import ValidationError
 
 
 class TestSoilProfile:
@@ -40,6 +43,37 @@ class TestSoilProfile:
         assert profile.get_layer_index(1.0) == 0
         assert profile.get_layer_index(3.0) == 1
         assert profile.get_layer_index(5.0) == 1
+        assert profile.get_layer_index(2.0) == 0  # Layer bottoms belong to the layer
+        assert profile.get_layer_index(8.0) == 1  # Below the profile
+
+    def test_get_layer_index_reuses_arrays(self, monkeypatch):
+        """Test that lookups read no layer until a layer changes."""
+        profile = SoilProfile(
+            layers=[
+                SoilLayer(thickness=0.5, dry_unit_weight=1.8, saturated_unit_weight=2.0)
+                for _ in range(200)
+            ],
+            ground_water_level=2.5,
+        )
+        profile.get_layer_index(1.0)
+
+        # Count the layer reads done by an array rebuild
+        reads = []
+        layer_row = soil_profile_module._layer_row
+        monkeypatch.setattr(
+            soil_profile_module,
+            "_layer_row",
+            lambda layer: reads.append(layer) or layer_row(layer),
+        )
+
+        for i in range(100):
+            assert profile.get_layer_index(i * 0.5) == max(i - 1, 0)
+        assert reads == []
+
+        profile.layers[10].dry_unit_weight = 1.7
+        assert profile.get_layer_index(30.0) == 59
+        assert profile.get_layer_index(60.0) == 119
+        assert len(reads) == 200
 
     def test_calc_normal_stress(self):
         """Test normal stress calculations at different depths."""
@@ -56,3 +90,155 @@ class TestSoilProfile:
         assert abs(profile.calc_effective_stress(1.0) - 1.8) < 1e-3
         assert abs(profile.calc_effective_stress(2.0) - 3.6) < 1e-3
         assert abs(profile.calc_effective_stress(3.0) - 4.8595) < 1e-3
+
+    def test_calc_stresses(self):
+        """Test that both stresses come out of one call."""
+        profile = self.setup_soil_profile()
+
+        for depth in (1.0, 2.0, 3.0):
+            normal_stress, effective_stress = profile.calc_stresses(depth)
+            assert normal_stress == profile.calc_normal_stress(depth)
+            assert effective_stress == profile.calc_effective_stress(depth)
+
+        normal_stress, effective_stress = profile.calc_stresses(3.0)
+        assert abs(normal_stress - 5.35) < 1e-3
+        assert abs(effective_stress - 4.8595) < 1e-3
+
+    def test_calc_normal_stress_below_profile(self):
+        """Test that the last layer is extended below the bottom of the profile."""
+        profile = self.setup_soil_profile()
+
+        # 3.6 + 0.5 * 1.6 + 4.5 * 1.9
+        assert abs(profile.calc_normal_stress(7.0) - 12.95) < 1e-3
+
+    def test_calc_normal_stress_after_layer_change(self):
+        """Test that stresses follow layer changes once depths are recalculated."""
+        profile = self.setup_soil_profile()
+        assert abs(profile.calc_normal_stress(1.0) - 1.8) < 1e-3
+
+        profile.layers[0].dry_unit_weight = 1.7
+        profile.calc_layer_depths()
+
+        assert abs(profile.calc_normal_stress(1.0) - 1.7) < 1e-3
+
+    def test_normal_stress_at(self):
+        """Test that memoized normal stresses are invalidated by layer changes."""
+        profile = self.setup_soil_profile()
+
+        assert abs(profile.normal_stress_at(1.0) - 1.8) < 1e-3
+        assert abs(profile.normal_stress_at(1.0) - 1.8) < 1e-3
+        assert abs(profile.normal_stress_at(3.0) - 5.35) < 1e-3
+
+        profile.layers[0].dry_unit_weight = 1.7
+        profile.calc_layer_depths()
+
+        assert abs(profile.normal_stress_at(1.0) - 1.7) < 1e-3
+
+    def test_normal_stress_at_hit(self, monkeypatch):
+        """Test that a memoized depth is not recalculated until a layer changes."""
+        profile = self.setup_soil_profile()
+        profile.normal_stress_at(3.0)
+
+        calls = []
+        calc_normal_stress = SoilProfile.calc_normal_stress
+        monkeypatch.setattr(
+            SoilProfile,
+            "calc_normal_stress",
+            lambda self, depth: calls.append(depth) or calc_normal_stress(self, depth),
+        )
+
+        for _ in range(10):
+            assert abs(profile.normal_stress_at(3.0) - 5.35) < 1e-3
+        assert calls == []
+
+        profile.layers[1].saturated_unit_weight = 2.0
+        assert abs(profile.normal_stress_at(3.0) - 5.4) < 1e-3
+        assert calls == [3.0]
+
+    def test_stresses_follow_layer_edits(self):
+        """Test that editing or adding layers in place updates the stresses."""
+        profile = self.setup_soil_profile()
+        assert abs(profile.calc_normal_stress(4.0) - 7.25) < 1e-9
+
+        profile.layers[0].dry_unit_weight = 2.325
+        assert abs(profile.calc_normal_stress(4.0) - 8.3) < 1e-9
+        assert abs(profile.normal_stress_at(4.0) - 8.3) < 1e-9
+
+        profile.layers.append(
+            SoilLayer(thickness=2.0, dry_unit_weight=1.7, saturated_unit_weight=2.0)
+        )
+        result = profile.calc_effective_stress_batch([1.0, 6.5])
+        assert abs(profile.calc_normal_stress(6.5) - 13.2) < 1e-9
+        assert abs(result[1] - profile.calc_effective_stress(6.5)) < 1e-9
+        assert len(profile.precompute_effective_stress_array()) == 3
+
+    def test_equality_ignores_cache(self):
+        """Test that a calculation does not change how profiles compare."""
+        profile = self.setup_soil_profile()
+        other = self.setup_soil_profile()
+
+        profile.calc_effective_stress(3.0)
+        assert profile == other
+
+        other.layers[0].dry_unit_weight = 1.7
+        assert profile != other
+
+    def test_layer_soa(self):
+        """Test that the layer arrays follow the layers across recalculations."""
+        profile = self.setup_soil_profile()
+
+        soa = profile.layer_soa()
+        assert list(soa["center"]) == [layer.center for layer in profile.layers]
+        assert np.isnan(soa["water_content"]).all()
+
+        # Unchanged layers keep the arrays built before
+        profile.calc_layer_depths()
+        assert profile.layer_soa() is soa
+
+        profile.layers[0].water_content = 20.0
+        profile.calc_layer_depths()
+        assert abs(profile.layer_soa()["water_content"][0] - 20.0) < 1e-9
+
+    def test_calc_effective_stress_batch(self):
+        """Test that batched effective stresses match the single depth results."""
+        profile = self.setup_soil_profile()
+        depths = [0.0, 1.0, 2.0, 2.5, 3.0, 5.0, 7.0]
+
+        result = profile.calc_effective_stress_batch(depths)
+
+        assert len(result) == len(depths)
+        for depth, stress in zip(depths, result):
+            assert abs(stress - profile.calc_effective_stress(depth)) < 1e-9
+
+    def test_precompute_effective_stress_array(self):
+        """Test the cached effective stresses at the layer centers."""
+        profile = self.setup_soil_profile()
+
+        result = profile.precompute_effective_stress_array()
+
+        assert len(result) == len(profile.layers)
+        for layer, stress in zip(profile.layers, result):
+            assert abs(stress - profile.calc_effective_stress(layer.center)) < 1e-9
+
+        profile.ground_water_level = 0.5
+        result = profile.precompute_effective_stress_array()
+        for layer, stress in zip(profile.layers, result):
+            assert abs(stress - profile.calc_effective_stress(layer.center)) < 1e-9
+
+    def test_validate(self):
+        """Test validation of the layer fields."""
+        profile = self.setup_soil_profile()
+        profile.validate(["thickness", "dry_unit_weight", "saturated_unit_weight"])
+
+        profile.layers[1].dry_unit_weight = 12.0
+        with pytest.raises(ValidationError) as exc_info:
+            profile.validate(["thickness", "dry_unit_weight"])
+        assert exc_info.value.code == "soil_profile.dry_unit_weight.too_large.10.0"
+
+        with pytest.raises(ValidationError) as exc_info:
+            profile.validate(["thickness", "fine_content"])
+        assert exc_info.value.code == "soil_profile.fine_content.missing"
+
+        with pytest.raises(ValidationError) as exc_info:
+            profile.validate(["unknown"])
+        assert exc_info.value.code == "soil_profile.invalid_field"
@@ -1,7 +1,9 @@
 """Tests for SPT (Standard Penetration Test) model functions."""
 
+import numpy as np
 import pytest
 
+import soilpy.models.spt as spt_module
 from soilpy.enums import SelectionMethod
 from soilpy.models import SoilLayer, SoilProfile
 from soilpy.models.spt import SPT, NValue, SPTBlow, SPTExp
@@ -65,10 +67,47 @@ class TestNValue:
         assert NValue(value="R") == NValue(value="R")
         assert NValue(value=10) == NValue(value=10)
 
+    def test_nvalue_float_input(self):
+        """Test that whole floats are coerced to int and fractional ones rejected."""
+        n = NValue(value=10.0)
+        assert n == NValue(value=10)
+        assert isinstance(n.value, int)
+        with pytest.raises(ValueError):
+            NValue(value=10.5)
+        with pytest.raises(ValueError):
+            NValue(value="10")
+
+    def test_nvalue_value_setter(self):
+        """Test that value can be reassigned and is validated."""
+        n = NValue(value=10)
+        n.value = "R"
+        assert n == NValue(value="R")
+        n.value = 12.0
+        assert n.value == 12
+        with pytest.raises(ValueError):
+            n.value = "x"
+
+    def test_nvalue_model_dump(self):
+        """Test dumping an NValue to a dictionary."""
+        assert NValue(value=10).model_dump() == {"value": 10}
+        assert NValue(value="Refusal").model_dump() == {"value": "R"}
+
 
 class TestSPTBlow:
     """Test cases for SPTBlow class."""
 
+    def test_sptblow_nvalue_inputs(self):
+        """Test NValue fields built from dictionaries, floats and JSON."""
+        blow = SPTBlow(n={"value": 5.0}, n60={"value": "R"})
+        assert blow.n == NValue(value=5)
+        assert isinstance(blow.n.value, int)
+        assert blow.n60 == NValue(value="R")
+        assert blow.model_dump()["n"] == {"value": 5}
+        assert SPTBlow.model_validate_json('{"n": {"value": 7}}').n == NValue(value=7)
+        for bad in ({"value": 5.5}, {"value": "10"}, 5):
+            with pytest.raises(ValueError):
+                SPTBlow(n=bad)
+
     def test_sptblow_new(self):
         """Test SPTBlow creation."""
         spt = SPTBlow.new(10.0, NValue(value=25))
@@ -99,6 +138,14 @@ class TestSPTBlow:
         expected_cn = min((1.0 / (9.81 * 0.5)) ** 0.5 * 9.78, 1.7)
         assert abs(spt.cn - expected_cn) < 0.001
 
+    def test_set_cr(self):
+        """Test rod length correction factor setting."""
+        expected = [(4.0, 0.75), (4.5, 0.85), (6.0, 0.85), (10.0, 0.95), (10.5, 1.0)]
+        for depth, cr in expected:
+            spt = SPTBlow.new(depth, NValue(value=25))
+            spt.set_cr()
+            assert spt.cr == cr
+
     def test_set_alpha_beta(self):
         """Test alpha and beta factors setting."""
         spt = SPTBlow.new(10.0, NValue(value=25))
@@ -145,6 +192,78 @@ class TestSPTBlow:
         assert spt.n1_60f.to_i32() == 22
 
 
+class TestSPTExp:
+    """Test cases for SPTExp class."""
+
+    def test_n_array(self):
+        """Test the N-value array with refusals and missing values."""
+        exp = SPTExp.new([], "exp")
+        for depth, n in [(1.5, 10), (3.0, "R"), (4.5, 22)]:
+            exp.add_blow(depth, NValue(value=n))
+        exp.blows[2].n = None
+
+        n_values = exp.n_array("n")
+
+        assert list(n_values[:2]) == [10.0, 50.0]
+        assert n_values[2] != n_values[2]  # NaN
+        assert list(exp.depth_array()) == [1.5, 3.0, 4.5]
+
+    def test_from_arrays(self):
+        """Test that an experiment built from arrays matches the one built per blow."""
+        expected = SPTExp.new([], "exp")
+        for depth, n in [(1.5, 10), (3.0, "R"), (4.5, 22)]:
+            expected.add_blow(depth, NValue(value=n))
+
+        exp = SPTExp.from_arrays(
+            np.array([1.5, 3.0, 4.5]),
+            np.array([10, 0, 22]),
+            np.array([False, True, False]),
+            "exp",
+        )
+
+        assert exp == expected
+        assert list(exp.n_array("n")) == [10.0, 50.0, 22.0]
+
+        with pytest.raises(ValueError):
+            SPTExp.from_arrays(np.array([1.5, 3.0]), np.array([10.5, 12.0]))
+
+    def test_apply_corrections(self):
+        """Test that experiment corrections match the per-blow corrections."""
+        soil_profile = SoilProfile(
+            layers=[
+                SoilLayer(
+                    thickness=3.0,
+                    dry_unit_weight=1.8,
+                    saturated_unit_weight=2.0,
+                    fine_content=4.0,
+                ),
+                SoilLayer(
+                    thickness=9.0,
+                    dry_unit_weight=1.9,
+                    saturated_unit_weight=2.1,
+                    fine_content=20.0,
+                ),
+            ],
+            ground_water_level=2.0,
+        )
+
+        exp = SPTExp.new([], "exp")
+        for depth, n in [(11.0, 35), (1.5, 10), (5.0, "R"), (8.0, 22)]:
+            exp.add_blow(depth, NValue(value=n))
+        expected = [SPTBlow.new(blow.depth, blow.n) for blow in exp.blows]
+
+        exp.apply_corrections(soil_profile, 0.9, 1.05, 1.2)
+        for blow in expected:
+            blow.apply_corrections(soil_profile, 0.9, 1.05, 1.2)
+
+        assert [blow.cr for blow in exp.blows] == [1.0, 0.75, 0.85, 0.95]
+        for blow, expected_blow in zip(exp.blows, expected):
+            assert abs(blow.cn - expected_blow.cn) < 1e-9
+            assert blow.alpha == expected_blow.alpha
+            assert blow.n1_60 == expected_blow.n1_60
+            assert blow.n1_60f == expected_blow.n1_60f
+
+
 class TestSPT:
     """Test cases for SPT class."""
 
@@ -205,3 +324,117 @@ class TestSPT:
         assert idealized_exp_max.blows[0].n == NValue(value=15)
         assert idealized_exp_max.blows[1].n == NValue(value=20)
         assert idealized_exp_max.blows[2].n == NValue(value="R")
+
+    def test_get_idealized_exp_sorted_depths(self):
+        """Test that idealized blows are ordered by depth across experiments."""
+        exp1 = SPTExp.new([], "exp1")
+        exp1.add_blow(3.0, NValue(value=12))
+
+        exp2 = SPTExp.new([], "exp2")
+        exp2.add_blow(1.5, NValue(value=8))
+        exp2.add_blow(3.0, NValue(value="R"))
+
+        spt = SPT.new(1.0, 1.0, 1.0, SelectionMethod.MIN)
+        spt.add_exp(exp1)
+        spt.add_exp(exp2)
+
+        idealized_exp = spt.get_idealized_exp("idealized")
+
+        assert [blow.depth for blow in idealized_exp.blows] == [1.5, 3.0]
+        assert idealized_exp.blows[0].n == NValue(value=8)
+        assert idealized_exp.blows[1].n == NValue(value=12)
+
+    def test_get_idealized_exp_after_add_exp(self):
+        """Test that adding an experiment updates the idealized experiment."""
+        exp1 = SPTExp.new([], "exp1")
+        exp1.add_blow(1.5, NValue(value=10))
+
+        spt = SPT.new(1.0, 1.0, 1.0, SelectionMethod.MAX)
+        spt.add_exp(exp1)
+
+        first = spt.get_idealized_exp("first")
+        second = spt.get_idealized_exp("second")
+
+        assert second.name == "second"
+        assert second.blows[0] is not first.blows[0]
+        assert second.blows[0].n == NValue(value=10)
+
+        exp2 = SPTExp.new([], "exp2")
+        exp2.add_blow(1.5, NValue(value=25))
+        spt.add_exp(exp2)
+
+        idealized_exp = spt.get_idealized_exp("idealized")
+
+        assert idealized_exp.blows[0].n == NValue(value=25)
+
+    def test_get_idealized_exp_after_blow_edits(self):
+        """Test that added or edited blows update the idealized experiment."""
+        exp1 = SPTExp.new([], "exp1")
+        exp1.add_blow(1.5, NValue(value=10))
+
+        spt = SPT.new(1.0, 1.0, 1.0, SelectionMethod.MAX)
+        spt.add_exp(exp1)
+        spt.get_idealized_exp("first")
+
+        exp1.add_blow(3.0, NValue(value=18))
+        idealized_exp = spt.get_idealized_exp("added")
+
+        assert [blow.depth for blow in idealized_exp.blows] == [1.5, 3.0]
+        assert idealized_exp.blows[1].n == NValue(value=18)
+
+        exp1.blows[0].n = NValue(value=30)
+        idealized_exp = spt.get_idealized_exp("edited")
+
+        assert idealized_exp.blows[0].n == NValue(value=30)
+
+        exp1.blows[0].n.value = 35
+        exp1.blows.append(SPTBlow.new(4.5, NValue(value=40)))
+        idealized_exp = spt.get_idealized_exp("in place")
+
+        assert idealized_exp.blows[0].n == NValue(value=35)
+        assert idealized_exp.blows[2].n == NValue(value=40)
+
+        idealized_exp.blows[0].n.value = 1
+        assert spt.get_idealized_exp("again").blows[0].n == NValue(value=35)
+
+    def test_get_idealized_exp_hit(self, monkeypatch):
+        """Test that a cache hit does not read the blows."""
+        calls = []
+        blow_pairs = spt_module._blow_pairs
+
+        def counting_blow_pairs(exps):
+            calls.append(len(exps))
+            return blow_pairs(exps)
+
+        monkeypatch.setattr(spt_module, "_blow_pairs", counting_blow_pairs)
+
+        exps = [
+            SPTExp.from_arrays(np.arange(1.5, 30.0, 1.5), np.arange(1, 20), name=name)
+            for name in ("exp1", "exp2")
+        ]
+        spt = SPT.new(1.0, 1.0, 1.0, SelectionMethod.AVG)
+        for exp in exps:
+            spt.add_exp(exp)
+
+        first = spt.get_idealized_exp("first")
+        for _ in range(10):
+            spt.get_idealized_exp("hit")
+        exps[0].apply_corrections(
+            SoilProfile(
+                layers=[
+                    SoilLayer(thickness=40.0, dry_unit_weight=1.8, fine_content=10.0)
+                ],
+                ground_water_level=40.0,
+            ),
+            1.0,
+            1.0,
+            1.0,
+        )
+        assert spt.get_idealized_exp("corrected") == first.model_copy(
+            update={"name": "corrected"}
+        )
+        assert calls == [2]
+
+        spt.idealization_method = SelectionMethod.MAX
+        spt.get_idealized_exp("method")
+        assert calls == [2, 2]
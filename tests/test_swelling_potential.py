@@ -1,63 +1,123 @@
 """Tests for swelling potential calculations."""
 
+import numpy as np
 import pytest
 
+from soilpy._swelling_kernels import _compute, _compute_numpy
 from soilpy.models import Foundation, SoilLayer, SoilProfile
 from soilpy.swelling_potential import calc_swelling_potential
+from soilpy.validation import ValidationError
+
+
+@pytest.fixture(scope="class")
+def soil_profile() -> SoilProfile:
+    """Creates a reusable soil profile for testing."""
+    return SoilProfile(
+        ground_water_level=5.0,
+        layers=[
+            SoilLayer(
+                thickness=3.0,
+                dry_unit_weight=1.8,
+                saturated_unit_weight=1.9,
+                depth=3.0,
+                liquid_limit=43.9,
+                plastic_limit=21.3,
+                water_content=23.7,
+            ),
+            SoilLayer(
+                thickness=5.0,
+                dry_unit_weight=1.9,
+                saturated_unit_weight=2.0,
+                depth=8.0,
+                liquid_limit=58.85,
+                plastic_limit=37.4,
+                water_content=75.4,
+            ),
+            SoilLayer(
+                thickness=50.0,
+                dry_unit_weight=2.0,
+                saturated_unit_weight=2.1,
+                depth=58.0,
+                liquid_limit=2.3,
+                plastic_limit=0.0,
+                water_content=22.5,
+            ),
+        ],
+    )
+
+
+@pytest.fixture(scope="class")
+def foundation_data() -> Foundation:
+    """Creates test foundation data."""
+    return Foundation(
+        foundation_width=10.0,
+        foundation_length=20.0,
+        foundation_depth=2.0,
+    )
 
 
 class TestSwellingPotential:
     """Test cases for swelling potential calculations."""
 
-    def create_soil_profile(self) -> SoilProfile:
-        """Creates a reusable soil profile for testing."""
-        return SoilProfile(
-            ground_water_level=5.0,
-            layers=[
-                SoilLayer(
-                    thickness=3.0,
-                    dry_unit_weight=1.8,
-                    saturated_unit_weight=1.9,
-                    depth=3.0,
-                    liquid_limit=43.9,
-                    plastic_limit=21.3,
-                    water_content=23.7,
-                ),
-                SoilLayer(
-                    thickness=5.0,
-                    dry_unit_weight=1.9,
-                    saturated_unit_weight=2.0,
-                    depth=8.0,
-                    liquid_limit=58.85,
-                    plastic_limit=37.4,
-                    water_content=75.4,
-                ),
-                SoilLayer(
-                    thickness=50.0,
-                    dry_unit_weight=2.0,
-                    saturated_unit_weight=2.1,
-                    depth=58.0,
-                    liquid_limit=2.3,
-                    plastic_limit=0.0,
-                    water_content=22.5,
-                ),
-            ],
-        )
-
-    def create_foundation_data(self) -> Foundation:
-        """Creates test foundation data."""
-        return Foundation(
-            foundation_width=10.0,
-            foundation_length=20.0,
-            foundation_depth=2.0,
-        )
-
-    def test_calc_swelling_potential(self):
+    def test_calc_swelling_potential(self, soil_profile, foundation_data):
         """Test swelling potential calculation."""
-        soil_profile = self.create_soil_profile()
-        foundation_data = self.create_foundation_data()
         foundation_pressure = 50.0
 
         result = calc_swelling_potential(soil_profile, foundation_data, foundation_pressure)
         expected_pressure = 8.89
         assert abs(result.data[0].swelling_pressure - expected_pressure) < 0.01
+
+    def test_calc_swelling_potential_stresses(self, soil_profile, foundation_data):
+        """Test the stresses at the layer centers against the soil profile."""
+        result = calc_swelling_potential(soil_profile, foundation_data, 50.0)
+
+        for layer_data in result.data:
+            center = layer_data.layer_center
+            expected = 0.0
+            if center >= foundation_data.foundation_depth:
+                expected = soil_profile.calc_effective_stress(center)
+            assert abs(layer_data.effective_stress - expected) < 1e-9
+            assert layer_data.is_safe == (
+                layer_data.swelling_pressure
+                <= layer_data.effective_stress + layer_data.delta_stress
+            )
+
+    def test_calc_swelling_potential_dump(self, soil_profile, foundation_data):
+        """Test that the layer records serialize by field name."""
+        result = calc_swelling_potential(soil_profile, foundation_data, 50.0)
+
+        dumped = result.model_dump()["data"][0]
+        assert set(dumped) == {
+            "layer_center",
+            "effective_stress",
+            "delta_stress",
+            "swelling_pressure",
+            "is_safe",
+        }
+        assert dumped["layer_center"] == result.data[0].layer_center
+
+    def test_kernels_match(self):
+        """Test that the numba and numpy kernels give the same bits."""
+        rng = np.random.default_rng(7)
+        n = 10_000
+        centers = np.cumsum(rng.uniform(0.3, 5.0, n))
+        eff_stress = rng.uniform(0.0, 200.0, n)
+        wc = rng.uniform(5.0, 60.0, n)
+        ll = rng.uniform(20.0, 80.0, n)
+        pl = rng.uniform(0.0, 40.0, n)
+        dry_uw = rng.uniform(1.5, 2.0, n)
+        has_plastic = rng.uniform(size=n) < 0.9
+
+        args = (centers, eff_stress, wc, ll, pl, dry_uw, has_plastic)
+        args += (40.0, 10.0, 20.0, 5000.0)
+        for jitted, plain in zip(_compute(*args), _compute_numpy(*args)):
+            assert np.array_equal(jitted, plain)
+
+    def test_calc_swelling_potential_negative_pressure(
+        self, soil_profile, foundation_data
+    ):
+        """Test that a negative foundation pressure is rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            calc_swelling_potential(soil_profile, foundation_data, -1.0)
+
+        assert exc_info.value.code == "loads.foundation_pressure.too_small.0.0"
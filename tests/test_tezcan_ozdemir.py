@@ -9,7 +9,8 @@ from soilpy.models.masw import Masw, MaswExp, MaswLayer
 from soilpy.models.soil_profile import SoilLayer, SoilProfile
 
 
-def create_soil_profile() -> SoilProfile:
+@pytest.fixture(scope="module")
+def soil_profile() -> SoilProfile:
     """Create a test soil profile."""
     return SoilProfile(
         ground_water_level=0.0,
@@ -24,6 +25,16 @@ def create_soil_profile() -> SoilProfile:
     )
 
 
+@pytest.fixture(scope="module")
+def foundation() -> Foundation:
+    """Create a test foundation."""
+    return Foundation(
+        foundation_depth=5.0,
+        foundation_width=1.0,
+        foundation_length=1.0,
+    )
+
+
 def create_masw_exp(vs: float) -> Masw:
     """Create a test MASW experiment."""
     return Masw(
@@ -47,56 +58,23 @@ def create_masw_exp(vs: float) -> Masw:
 class TestTezcanOzdemir:
     """Test cases for Tezcan-Ozdemir bearing capacity calculations."""
 
-    def test_bc_tezcan_ozdemir_1(self):
-        """Test for VS >= 4000"""
-        soil_profile = create_soil_profile()
-        masw_exp = create_masw_exp(4001.0)
-        foundation = Foundation(
-            foundation_depth=5.0,
-            foundation_width=1.0,
-            foundation_length=1.0,
-        )
-
-        foundation_pressure = 100.0
-
-        result = calc_bearing_capacity(soil_profile, masw_exp, foundation, foundation_pressure)
-
-        assert result.is_safe
-        assert abs(result.allowable_bearing_capacity - 568.142) < 1e-5
-        assert abs(result.safety_factor - 1.4) < 1e-5
-
-    def test_bc_tezcan_ozdemir_2(self):
-        """Test for VS = 3000"""
-        soil_profile = create_soil_profile()
-        masw_exp = create_masw_exp(3000.0)
-        foundation = Foundation(
-            foundation_depth=5.0,
-            foundation_width=1.0,
-            foundation_length=1.0,
-        )
-
-        foundation_pressure = 100.0
-
-        result = calc_bearing_capacity(soil_profile, masw_exp, foundation, foundation_pressure)
-
-        assert result.is_safe
-        assert abs(result.allowable_bearing_capacity - 272.72727) < 1e-5
-        assert abs(result.safety_factor - 2.2) < 1e-5
-
-    def test_bc_tezcan_ozdemir_3(self):
-        """Test for VS = 400"""
-        soil_profile = create_soil_profile()
-        masw_exp = create_masw_exp(400.0)
-        foundation = Foundation(
-            foundation_depth=5.0,
-            foundation_width=1.0,
-            foundation_length=1.0,
-        )
-
+    @pytest.mark.parametrize(
+        "vs,expected_qa,expected_sf,is_safe",
+        [
+            (4001.0, 568.142, 1.4, True),  # VS >= 4000
+            (3000.0, 272.72727, 2.2, True),
+            (400.0, 20.0, 4.0, False),
+        ],
+    )
+    def test_bc_tezcan_ozdemir(
+        self, soil_profile, foundation, vs, expected_qa, expected_sf, is_safe
+    ):
+        """Test the bearing capacity for several shear wave velocities."""
+        masw_exp = create_masw_exp(vs)
         foundation_pressure = 100.0
 
         result = calc_bearing_capacity(soil_profile, masw_exp, foundation, foundation_pressure)
 
-        assert not result.is_safe
-        assert abs(result.allowable_bearing_capacity - 20.0) < 1e-5
-        assert abs(result.safety_factor - 4.0) < 1e-5
+        assert result.is_safe == is_safe
+        assert abs(result.allowable_bearing_capacity - expected_qa) < 1e-5
+        assert abs(result.safety_factor - expected_sf) < 1e-5
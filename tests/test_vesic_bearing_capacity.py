@@ -1,49 +1,98 @@
 """Tests for Vesic bearing capacity calculations."""
 
+import numpy as np
 import pytest
 
 from soilpy.bearing_capacity.model import BearingCapacityFactors
 from soilpy.bearing_capacity.vesic import (
     calc_base_factors,
     calc_bearing_capacity_factors,
+    calc_bearing_capacity_factors_many,
     calc_depth_factors,
+    calc_depth_factors_batch,
     calc_ground_factors,
+    calc_ground_factors_batch,
     calc_inclination_factors,
+    calc_inclination_factors_batch,
     calc_shape_factors,
 )
 from soilpy.models.foundation import Foundation
 from soilpy.models.loads import Loads
 
+# Bearing capacity factors shared by the shape and inclination factor cases
+BCF_PHI0 = BearingCapacityFactors(nc=5.14, nq=1.0, ng=0.0)
+BCF_UNIT = BearingCapacityFactors(nc=1.0, nq=1.0, ng=1.0)
+BCF_UNIT_NQ18 = BearingCapacityFactors(nc=1.0, nq=18.401, ng=1.0)
+
+
+@pytest.fixture(scope="module")
+def bcf_phi30() -> BearingCapacityFactors:
+    """Bearing capacity factors of phi = 30, from the function under test."""
+    return calc_bearing_capacity_factors(30.0)
+
+
+@pytest.fixture(scope="module")
+def inclination_foundation() -> Foundation:
+    """Foundation shared by the inclination factor cases with phi = 30."""
+    return Foundation(
+        foundation_depth=1.0,
+        foundation_width=1.0,
+        foundation_length=1.5,
+        effective_width=1.0,
+        effective_length=1.5,
+    )
+
+
+@pytest.fixture(scope="module")
+def base_foundation() -> Foundation:
+    """Foundation the base factor cases copy with their own angles."""
+    return Foundation(
+        foundation_depth=1.0,
+        foundation_width=2.0,
+        foundation_length=2.0,
+    )
+
 
 class TestCalcBearingCapacityFactors:
     """Test cases for calc_bearing_capacity_factors function."""
 
-    def test_calc_bearing_capacity_factors_1(self):
-        """Case 1: φ = 0°, pure cohesive soil — should return Nc = 5.14, Nq = 1.0, Ng = 0.0"""
-        phi = 0.0
+    @pytest.mark.parametrize(
+        "phi,expected_nc,expected_nq,expected_ng",
+        [
+            (0.0, 5.14, 1.0, 0.0),  # pure cohesive soil
+            (10.0, 8.345, 2.471, 0.519),  # soft granular soil
+            (30.0, 30.14, 18.401, 20.093),  # typical for dense sand
+        ],
+    )
+    def test_calc_bearing_capacity_factors(
+        self, phi, expected_nc, expected_nq, expected_ng
+    ):
+        """Test the bearing capacity factors for several friction angles."""
         result = calc_bearing_capacity_factors(phi)
 
-        assert abs(result.nc - 5.14) < 1e-3
-        assert abs(result.nq - 1.0) < 1e-3
-        assert abs(result.ng - 0.0) < 1e-3
+        np.testing.assert_allclose(
+            [result.nc, result.nq, result.ng],
+            [expected_nc, expected_nq, expected_ng],
+            rtol=0,
+            atol=1e-3,
+        )
 
-    def test_calc_bearing_capacity_factors_2(self):
-        """Case 2: φ = 10° — soft granular soil"""
-        phi = 10.0
-        result = calc_bearing_capacity_factors(phi)
+    def test_calc_bearing_capacity_factors_many(self):
+        """Test that the array version matches the scalar factors."""
+        phi = np.linspace(0.0, 40.0, 41)
 
-        assert abs(result.nc - 8.345) < 1e-3
-        assert abs(result.nq - 2.471) < 1e-3
-        assert abs(result.ng - 0.519) < 1e-3
+        nc, nq, ng = calc_bearing_capacity_factors_many(phi)
 
-    def test_calc_bearing_capacity_factors_3(self):
-        """Case 3: φ = 30° — typical for dense sand"""
-        phi = 30.0
-        result = calc_bearing_capacity_factors(phi)
-
-        assert abs(result.nc - 30.14) < 1e-3
-        assert abs(result.nq - 18.401) < 1e-3
-        assert abs(result.ng - 20.093) < 1e-3
+        np.testing.assert_allclose(
+            nc[[0, 10, 30]], [5.14, 8.345, 30.14], rtol=0, atol=1e-3
+        )
+        for i, value in enumerate(phi):
+            expected = calc_bearing_capacity_factors(value)
+            np.testing.assert_allclose(
+                [nc[i], nq[i], ng[i]],
+                [expected.nc, expected.nq, expected.ng],
+                rtol=1e-12,
+            )
 
 
 class TestCalcShapeFactors:
@@ -58,18 +107,12 @@ class TestCalcShapeFactors:
         )
         phi = 0.0
 
-        bc_factors = BearingCapacityFactors(
-            nc=5.14,
-            nq=1.0,
-            ng=0.0,
+        result = calc_shape_factors(foundation, BCF_PHI0, phi)
+        np.testing.assert_allclose(
+            [result.sc, result.sq, result.sg], [0.133, 1.0, 0.733], rtol=0, atol=1e-3
         )
 
-        result = calc_shape_factors(foundation, bc_factors, phi)
-        assert abs(result.sc - 0.133) < 1e-3
-        assert abs(result.sq - 1.0) < 1e-3
-        assert abs(result.sg - 0.733) < 1e-3
-
-    def test_calc_shape_factors_2(self):
+    def test_calc_shape_factors_2(self, bcf_phi30):
         """Case 2: φ = 30°, B/L = 1/1.5 = 0.667, Nq = 18.401, Nc = 30.140"""
         foundation = Foundation(
             foundation_depth=1.0,
@@ -78,17 +121,11 @@ class TestCalcShapeFactors:
         )
         phi = 30.0
 
-        bc_factors = BearingCapacityFactors(
-            nc=30.140,
-            nq=18.401,
-            ng=20.093,
+        result = calc_shape_factors(foundation, bcf_phi30, phi)
+        np.testing.assert_allclose(
+            [result.sc, result.sq, result.sg], [1.407, 1.333, 0.733], rtol=0, atol=1e-3
         )
 
-        result = calc_shape_factors(foundation, bc_factors, phi)
-        assert abs(result.sc - 1.407) < 1e-3
-        assert abs(result.sq - 1.333) < 1e-3
-        assert abs(result.sg - 0.733) < 1e-3
-
 
 class TestCalcInclinationFactors:
     """Test cases for calc_inclination_factors function."""
@@ -108,131 +145,79 @@ class TestCalcInclinationFactors:
             horizontal_load_x=0.0,
             horizontal_load_y=0.0,
         )
-
-        bc_factors = BearingCapacityFactors(
-            nc=1.0,
-            nq=1.0,
-            ng=1.0,
-        )
         phi = 0.0
         cohesion = 10.0
 
-        result = calc_inclination_factors(phi, cohesion, bc_factors, foundation, loads)
-        assert abs(result.ic - 1.0) < 1e-3
-        assert abs(result.iq - 1.0) < 1e-3
-        assert abs(result.ig - 1.0) < 1e-3
-
-    def test_calc_inclination_factors_2(self):
-        """Case 2: φ = 30°, c = 0, HL = 0, HB = 0, V = 200"""
-        foundation = Foundation(
-            foundation_depth=1.0,
-            foundation_width=1.0,
-            foundation_length=1.5,
-            effective_width=1.0,
-            effective_length=1.5,
+        result = calc_inclination_factors(phi, cohesion, BCF_UNIT, foundation, loads)
+        np.testing.assert_allclose(
+            [result.ic, result.iq, result.ig], [1.0, 1.0, 1.0], rtol=0, atol=1e-3
         )
 
+    def test_calc_inclination_factors_2(self, inclination_foundation):
+        """Case 2: φ = 30°, c = 0, HL = 0, HB = 0, V = 200"""
         loads = Loads(
             vertical_load=200.0,
             horizontal_load_x=0.0,
             horizontal_load_y=0.0,
         )
-        bc_factors = BearingCapacityFactors(
-            nc=1.0,
-            nq=18.401,
-            ng=1.0,
-        )
         phi = 30.0
         cohesion = 0.0
 
-        result = calc_inclination_factors(phi, cohesion, bc_factors, foundation, loads)
-        assert abs(result.ic - 1.0) < 1e-3
-        assert abs(result.iq - 1.0) < 1e-3
-        assert abs(result.ig - 1.0) < 1e-3
-
-    def test_calc_inclination_factors_3(self):
-        """Case 3: φ = 30°, c = 10, HL = 0, HB = 10, V = 200"""
-        foundation = Foundation(
-            foundation_depth=1.0,
-            foundation_width=1.0,
-            foundation_length=1.5,
-            effective_width=1.0,
-            effective_length=1.5,
+        result = calc_inclination_factors(
+            phi, cohesion, BCF_UNIT_NQ18, inclination_foundation, loads
         )
-
-        loads = Loads(
-            vertical_load=200.0,
-            horizontal_load_x=10.0,
-            horizontal_load_y=0.0,
-        )
-        bc_factors = BearingCapacityFactors(
-            nc=1.0,
-            nq=18.401,
-            ng=1.0,
-        )
-        phi = 30.0
-        cohesion = 10.0
-
-        result = calc_inclination_factors(phi, cohesion, bc_factors, foundation, loads)
-        assert abs(result.ic - 0.924) < 1e-3
-        assert abs(result.iq - 0.928) < 1e-3
-        assert abs(result.ig - 0.886) < 1e-3
-
-    def test_calc_inclination_factors_4(self):
-        """Case 4: φ = 30°, c = 10, HL = 10, HB = 0, V = 200"""
-        foundation = Foundation(
-            foundation_depth=1.0,
-            foundation_width=1.0,
-            foundation_length=1.5,
-            effective_width=1.0,
-            effective_length=1.5,
+        np.testing.assert_allclose(
+            [result.ic, result.iq, result.ig], [1.0, 1.0, 1.0], rtol=0, atol=1e-3
         )
 
+    @pytest.mark.parametrize(
+        "hb,hl,expected",
+        [
+            (10.0, 0.0, [0.924, 0.928, 0.886]),
+            (0.0, 10.0, [0.933, 0.937, 0.894]),
+            (10.0, 10.0, [0.805, 0.817, 0.742]),
+        ],
+    )
+    def test_calc_inclination_factors_horizontal_loads(
+        self, inclination_foundation, hb, hl, expected
+    ):
+        """Cases 3-5: φ = 30°, c = 10, V = 200 with horizontal loads"""
         loads = Loads(
             vertical_load=200.0,
-            horizontal_load_x=0.0,
-            horizontal_load_y=10.0,
-        )
-        bc_factors = BearingCapacityFactors(
-            nc=1.0,
-            nq=18.401,
-            ng=1.0,
+            horizontal_load_x=hb,
+            horizontal_load_y=hl,
         )
         phi = 30.0
         cohesion = 10.0
 
-        result = calc_inclination_factors(phi, cohesion, bc_factors, foundation, loads)
-        assert abs(result.ic - 0.933) < 1e-3
-        assert abs(result.iq - 0.937) < 1e-3
-        assert abs(result.ig - 0.894) < 1e-3
-
-    def test_calc_inclination_factors_5(self):
-        """Case 5: φ = 30°, c = 10, HL = 10, HB = 10, V = 200"""
-        foundation = Foundation(
-            foundation_depth=1.0,
-            foundation_width=1.0,
-            foundation_length=1.5,
-            effective_width=1.0,
-            effective_length=1.5,
-        )
-
-        loads = Loads(
-            vertical_load=200.0,
-            horizontal_load_x=10.0,
-            horizontal_load_y=10.0,
+        result = calc_inclination_factors(
+            phi, cohesion, BCF_UNIT_NQ18, inclination_foundation, loads
         )
-        bc_factors = BearingCapacityFactors(
-            nc=1.0,
-            nq=18.401,
-            ng=1.0,
+        np.testing.assert_allclose(
+            [result.ic, result.iq, result.ig], expected, rtol=0, atol=1e-3
         )
-        phi = 30.0
-        cohesion = 10.0
 
-        result = calc_inclination_factors(phi, cohesion, bc_factors, foundation, loads)
-        assert abs(result.ic - 0.805) < 1e-3
-        assert abs(result.iq - 0.817) < 1e-3
-        assert abs(result.ig - 0.742) < 1e-3
+    def test_calc_inclination_factors_batch(self, inclination_foundation):
+        """Test that batched inclination factors match the single load results."""
+        hb = np.array([0.0, 10.0, 0.0, 10.0])
+        hl = np.array([0.0, 0.0, 10.0, 10.0])
+
+        for phi, cohesion in [(30.0, 10.0), (0.0, 10.0)]:
+            ic, iq, ig = calc_inclination_factors_batch(
+                phi, cohesion, BCF_UNIT_NQ18, inclination_foundation, 200.0, hb, hl
+            )
+            for i in range(len(hb)):
+                loads = Loads(
+                    vertical_load=200.0,
+                    horizontal_load_x=hb[i],
+                    horizontal_load_y=hl[i],
+                )
+                result = calc_inclination_factors(
+                    phi, cohesion, BCF_UNIT_NQ18, inclination_foundation, loads
+                )
+                assert abs(ic[i] - result.ic) < 1e-12
+                assert abs(iq[i] - result.iq) < 1e-12
+                assert abs(ig[i] - result.ig) < 1e-12
 
 
 class TestCalcDepthFactors:
@@ -247,9 +232,9 @@ class TestCalcDepthFactors:
 
         phi = 0.0
         result = calc_depth_factors(foundation, phi)
-        assert abs(result.dc - 0.4) < 1e-3
-        assert abs(result.dq - 1.0) < 1e-3
-        assert abs(result.dg - 1.0) < 1e-3
+        np.testing.assert_allclose(
+            [result.dc, result.dq, result.dg], [0.4, 1.0, 1.0], rtol=0, atol=1e-3
+        )
 
     def test_calc_depth_factors_2(self):
         """Case 2: φ = 30°, Df/B = 1"""
@@ -260,9 +245,9 @@ class TestCalcDepthFactors:
 
         phi = 30.0
         result = calc_depth_factors(foundation, phi)
-        assert abs(result.dc - 1.4) < 1e-3
-        assert abs(result.dq - 1.289) < 1e-3
-        assert abs(result.dg - 1.0) < 1e-3
+        np.testing.assert_allclose(
+            [result.dc, result.dq, result.dg], [1.4, 1.289, 1.0], rtol=0, atol=1e-3
+        )
 
     def test_calc_depth_factors_3(self):
         """Case 3: φ = 0°, Df/B > 1"""
@@ -273,9 +258,9 @@ class TestCalcDepthFactors:
 
         phi = 0.0
         result = calc_depth_factors(foundation, phi)
-        assert abs(result.dc - 0.013957) < 1e-3
-        assert abs(result.dq - 1.0) < 1e-3
-        assert abs(result.dg - 1.0) < 1e-3
+        np.testing.assert_allclose(
+            [result.dc, result.dq, result.dg], [0.013957, 1.0, 1.0], rtol=0, atol=1e-3
+        )
 
     def test_calc_depth_factors_4(self):
         """Case 4: φ = 30°, Df/B > 1"""
@@ -286,109 +271,74 @@ class TestCalcDepthFactors:
 
         phi = 30.0
         result = calc_depth_factors(foundation, phi)
-        assert abs(result.dc - 1.013957) < 1e-3
-        assert abs(result.dq - 1.010073) < 1e-3
-        assert abs(result.dg - 1.0) < 1e-3
-
-
-class TestCalcBaseFactors:
-    """Test cases for calc_base_factors function."""
-
-    def test_calc_base_factors_1(self):
-        """Case 1: φ = 0°, slope = 0°, base = 0°"""
-        foundation = Foundation(
-            foundation_depth=1.0,
-            foundation_width=2.0,
-            foundation_length=2.0,
-            base_tilt_angle=0.0,
-            slope_angle=0.0,
+        np.testing.assert_allclose(
+            [result.dc, result.dq, result.dg],
+            [1.013957, 1.010073, 1.0],
+            rtol=0,
+            atol=1e-3,
         )
-        phi = 0.0
-        result = calc_base_factors(phi, foundation)
-
-        assert abs(result.bc - 0.0) < 1e-3
-        assert abs(result.bq - 1.0) < 1e-3
-        assert abs(result.bg - 1.0) < 1e-3
 
-    def test_calc_base_factors_2(self):
-        """Case 2: φ = 30°, slope = 0°, base = 0°"""
-        foundation = Foundation(
-            foundation_depth=1.0,
-            foundation_width=2.0,
-            foundation_length=2.0,
-            base_tilt_angle=0.0,
-            slope_angle=0.0,
+    def test_calc_depth_factors_batch(self):
+        """Test the depth factors over the (Df, phi) grid of cases 1-4."""
+        df = np.array([1.0, 1.0, 2.0, 2.0])
+        phi = np.array([0.0, 30.0, 0.0, 30.0])
+
+        dc, dq, dg = calc_depth_factors_batch(1.0, df, phi)
+
+        np.testing.assert_allclose(
+            np.column_stack([dc, dq, dg]),
+            [
+                [0.4, 1.0, 1.0],
+                [1.4, 1.289, 1.0],
+                [0.013957, 1.0, 1.0],
+                [1.013957, 1.010073, 1.0],
+            ],
+            rtol=0,
+            atol=1e-3,
         )
-        phi = 30.0
-        result = calc_base_factors(phi, foundation)
+        for i in range(len(df)):
+            foundation = Foundation(foundation_depth=df[i], foundation_width=1.0)
+            expected = calc_depth_factors(foundation, phi[i])
+            assert abs(dc[i] - expected.dc) < 1e-12
+            assert abs(dq[i] - expected.dq) < 1e-12
 
-        assert abs(result.bc - 1.0) < 1e-3
-        assert abs(result.bq - 1.0) < 1e-3
-        assert abs(result.bg - 1.0) < 1e-3
 
-    def test_calc_base_factors_3(self):
-        """Case 3: φ = 0°, slope = 10°, base = 0°"""
-        foundation = Foundation(
-            foundation_depth=1.0,
-            foundation_width=2.0,
-            foundation_length=2.0,
-            base_tilt_angle=0.0,
-            slope_angle=10.0,
-        )
-        phi = 0.0
-        result = calc_base_factors(phi, foundation)
-
-        assert abs(result.bc - 0.034) < 1e-3
-        assert abs(result.bq - 1.0) < 1e-3
-        assert abs(result.bg - 1.0) < 1e-3
-
-    def test_calc_base_factors_4(self):
-        """Case 4: φ = 0°, slope = 0°, base = 10°"""
-        foundation = Foundation(
-            foundation_depth=1.0,
-            foundation_width=2.0,
-            foundation_length=2.0,
-            base_tilt_angle=10.0,
-            slope_angle=0.0,
-        )
-        phi = 0.0
-        result = calc_base_factors(phi, foundation)
-
-        assert abs(result.bc - 0.0) < 1e-3
-        assert abs(result.bq - 1.0) < 1e-3
-        assert abs(result.bg - 1.0) < 1e-3
+class TestCalcBaseFactors:
+    """Test cases for calc_base_factors function."""
 
-    def test_calc_base_factors_5(self):
-        """Case 5: φ = 0°, slope = 10°, base = 10°"""
-        foundation = Foundation(
-            foundation_depth=1.0,
-            foundation_width=2.0,
-            foundation_length=2.0,
-            base_tilt_angle=10.0,
-            slope_angle=10.0,
+    @pytest.mark.parametrize(
+        "phi,slope_angle,base_tilt_angle,expected_bc,expected_bq,expected_bg",
+        [
+            (0.0, 0.0, 0.0, 0.0, 1.0, 1.0),
+            (30.0, 0.0, 0.0, 1.0, 1.0, 1.0),
+            (0.0, 10.0, 0.0, 0.034, 1.0, 1.0),
+            (0.0, 0.0, 10.0, 0.0, 1.0, 1.0),
+            (0.0, 10.0, 10.0, 0.034, 1.0, 1.0),
+            (30.0, 10.0, 10.0, 0.882, 0.809, 0.809),
+        ],
+    )
+    def test_calc_base_factors(
+        self,
+        base_foundation,
+        phi,
+        slope_angle,
+        base_tilt_angle,
+        expected_bc,
+        expected_bq,
+        expected_bg,
+    ):
+        """Test the base factors for several friction, slope and base tilt angles."""
+        foundation = base_foundation.model_copy(
+            update={"slope_angle": slope_angle, "base_tilt_angle": base_tilt_angle}
         )
-        phi = 0.0
         result = calc_base_factors(phi, foundation)
 
-        assert abs(result.bc - 0.034) < 1e-3
-        assert abs(result.bq - 1.0) < 1e-3
-        assert abs(result.bg - 1.0) < 1e-3
-
-    def test_calc_base_factors_6(self):
-        """Case 6: φ = 30°, slope = 10°, base = 10°"""
-        foundation = Foundation(
-            foundation_depth=1.0,
-            foundation_width=2.0,
-            foundation_length=2.0,
-            base_tilt_angle=10.0,
-            slope_angle=10.0,
+        np.testing.assert_allclose(
+            [result.bc, result.bq, result.bg],
+            [expected_bc, expected_bq, expected_bg],
+            rtol=0,
+            atol=1e-3,
         )
-        phi = 30.0
-        result = calc_base_factors(phi, foundation)
-
-        assert abs(result.bc - 0.882) < 1e-3
-        assert abs(result.bq - 0.809) < 1e-3
-        assert abs(result.bg - 0.809) < 1e-3
 
 
 class TestCalcGroundFactors:
@@ -400,9 +350,9 @@ class TestCalcGroundFactors:
         slope = 0.0
         iq = 1.0
         result = calc_ground_factors(iq, slope, phi)
-        assert abs(result.gc - 0.0) < 1e-3
-        assert abs(result.gq - 1.0) < 1e-3
-        assert abs(result.gg - 1.0) < 1e-3
+        np.testing.assert_allclose(
+            [result.gc, result.gq, result.gg], [0.0, 1.0, 1.0], rtol=0, atol=1e-3
+        )
 
     def test_calc_ground_factors_2(self):
         """Case 2: φ = 30°, slope = 0°"""
@@ -410,9 +360,9 @@ class TestCalcGroundFactors:
         slope = 0.0
         iq = 0.861
         result = calc_ground_factors(iq, slope, phi)
-        assert abs(result.gc - 0.814) < 1e-3
-        assert abs(result.gq - 1.0) < 1e-3
-        assert abs(result.gg - 1.0) < 1e-3
+        np.testing.assert_allclose(
+            [result.gc, result.gq, result.gg], [0.814, 1.0, 1.0], rtol=0, atol=1e-3
+        )
 
     def test_calc_ground_factors_3(self):
         """Case 3: φ = 0°, slope = 5°"""
@@ -420,9 +370,9 @@ class TestCalcGroundFactors:
         slope = 5.0
         iq = 1.0
         result = calc_ground_factors(iq, slope, phi)
-        assert abs(result.gc - 0.017) < 1e-3
-        assert abs(result.gq - 0.833) < 1e-3
-        assert abs(result.gg - 0.833) < 1e-3
+        np.testing.assert_allclose(
+            [result.gc, result.gq, result.gg], [0.017, 0.833, 0.833], rtol=0, atol=1e-3
+        )
 
     def test_calc_ground_factors_4(self):
         """Case 4: φ = 30°, slope = 5°"""
@@ -430,6 +380,23 @@ class TestCalcGroundFactors:
         slope = 5.0
         iq = 0.861
         result = calc_ground_factors(iq, slope, phi)
-        assert abs(result.gc - 0.814) < 1e-3
-        assert abs(result.gq - 0.833) < 1e-3
-        assert abs(result.gg - 0.833) < 1e-3
+        np.testing.assert_allclose(
+            [result.gc, result.gq, result.gg], [0.814, 0.833, 0.833], rtol=0, atol=1e-3
+        )
+
+    def test_calc_ground_factors_batch(self):
+        """Test the ground factors over the phi and slope grid of cases 1-4."""
+        phi, slope = np.meshgrid([0.0, 30.0], [0.0, 5.0], indexing="ij")
+        iq = np.where(phi == 0.0, 1.0, 0.861)
+
+        gc, gq, gg = calc_ground_factors_batch(iq, slope, phi)
+
+        np.testing.assert_allclose(
+            gc, [[0.0, 0.017], [0.814, 0.814]], rtol=0, atol=1e-3
+        )
+        np.testing.assert_allclose(gq, [[1.0, 0.833], [1.0, 0.833]], rtol=0, atol=1e-3)
+        np.testing.assert_allclose(gg, gq, rtol=0, atol=0)
+        for index in np.ndindex(phi.shape):
+            expected = calc_ground_factors(iq[index], slope[index], phi[index])
+            assert abs(gc[index] - expected.gc) < 1e-12
+            assert abs(gq[index] - expected.gq) < 1e-12